@@ -25,9 +25,19 @@
 
 import os
 import io
+import copy
 import json
+import mmap
+import hashlib
+import functools
+import heapq
+import tempfile
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import datetime
+import time
 import asyncio
 from typing import Dict, List, Tuple, Optional
 
@@ -45,6 +55,27 @@ try:
 except ImportError:
     GOOGLE_DRIVE_AVAILABLE = False
 
+# Fast JSON (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Fuzzy name matching (optional)
+try:
+    from rapidfuzz import process as fuzz_process, fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Fast non-cryptographic hashing for upload duplicate detection (optional)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 # ========= Constants / Paths =========
 CONFIG_FILE = os.path.join(os.path.dirname(__file__), "config.json")
 
@@ -82,46 +113,77 @@ def format_position_change(value: float) -> str:
     else:
         return f"{int(value)}"
 
-def _sort_key(metric: str, row: dict) -> float:
-    v = safe_float(row.get(metric, 0))
-    if metric in ("avg_start", "avg_finish", "avg_incidents"):  # lower is better
-        return -v  # Simply negate the value, treat 0.0 as 0.0
-    # Percentage metrics (higher is better) - sort normally
-    elif metric in ("wins_pct", "podiums_pct", "top10s_pct", "poles_pct", "laps_complete_pct", "laps_lead_pct"):
-        return v
-    return v
+LOWER_IS_BETTER = ("avg_start", "avg_finish", "avg_incidents")
+
+def _make_sort_key(metric: str):
+    """Row key for metric, sorted with reverse=True; lower-is-better metrics are negated"""
+    if metric in LOWER_IS_BETTER:
+        return lambda row: -row.get(metric, 0)
+    return lambda row: row.get(metric, 0)
+
+# Sort key per metric, built once instead of re-checking the metric for every row
+_SORT_KEYS = {key: _make_sort_key(key) for (_, key) in FILTERS}
+
+def _sort_key_for(metric: str):
+    key = _SORT_KEYS.get(metric)
+    if key is None:
+        key = _SORT_KEYS[metric] = _make_sort_key(metric)
+    return key
+
+# Career aggregate and sorted leaderboard rows, reused until the season files change
+_CAREER_CACHE: dict = {}
+_ROWS_CACHE: dict = {}
+_ROWS_CACHE_MAX = 64
 
 def _aggregate_career() -> dict:
+    """Career totals across all seasons, recomputed only when a season file changes"""
+    sig = _season_signature()
+    cached = _CAREER_CACHE.get("career")
+    if cached and cached[0] == sig:
+        return cached[1]
+    out = _compute_career()
+    _CAREER_CACHE["career"] = (sig, out)
+    return out
+
+def _compute_career() -> dict:
     """Aggregate driver stats across all seasons into career totals"""
     out: dict = {}
+    # Race-weighted sums per driver for the averaged fields, divided once at the end
+    # (same result as folding a running weighted average season by season)
+    wsums: Dict[str, list] = {}
     for s in list_seasons():
         sd = load_season_drivers(s)
         for name, d in sd.items():
-            o = out.setdefault(name, {
-                "country": d.get("country"), 
-                "races": 0, 
-                "wins": 0, 
-                "poles": 0,
-                "podiums": 0, 
-                "top10s": 0, 
-                "points": 0.0,
-                "avg_incidents": 0.0, 
-                "avg_start": 0.0, 
-                "avg_finish": 0.0, 
-                "_rp": 0,
-                "laps_complete": 0,
-                "laps_lead": 0,
-                "fastest_laps": 0,
-                "race_distances": [],
-                "position_change": 0.0,
-                # Percentage fields
-                "wins_pct": 0.0,
-                "podiums_pct": 0.0,
-                "top10s_pct": 0.0,
-                "poles_pct": 0.0,
-                "laps_complete_pct": 0.0,
-                "laps_lead_pct": 0.0
-            })
+            o = out.get(name)
+            if o is None:
+                o = out[name] = {
+                    "country": d.get("country"), 
+                    "races": 0, 
+                    "wins": 0, 
+                    "poles": 0,
+                    "podiums": 0, 
+                    "top10s": 0, 
+                    "points": 0.0,
+                    "avg_incidents": 0.0, 
+                    "avg_start": 0.0, 
+                    "avg_finish": 0.0, 
+                    "_rp": 0,
+                    "laps_complete": 0,
+                    "laps_lead": 0,
+                    "fastest_laps": 0,
+                    "race_distances": [],
+                    "position_change": 0.0,
+                    # Percentage fields
+                    "wins_pct": 0.0,
+                    "podiums_pct": 0.0,
+                    "top10s_pct": 0.0,
+                    "poles_pct": 0.0,
+                    "laps_complete_pct": 0.0,
+                    "laps_lead_pct": 0.0
+                }
+                ws = wsums[name] = [0.0, 0.0, 0.0]
+            else:
+                ws = wsums[name]
             
             races_new = int(d.get("races", 0))
             o["races"] += races_new
@@ -138,22 +200,18 @@ def _aggregate_career() -> dict:
             if "race_distances" in d:
                 o["race_distances"].extend(d.get("race_distances", []))
             
-            # weighted avgs
-            def wavg(prev, add, rp, ra):
-                prev = safe_float(prev); add = safe_float(add); tot = rp + ra
-                return (prev * rp + add * ra) / tot if tot > 0 else 0.0
-            
-            rp = int(o.get("_rp", 0)); ra = races_new
-            o["avg_incidents"] = wavg(o["avg_incidents"], d.get("avg_incidents", 0), rp, ra)
-            o["avg_start"] = wavg(o["avg_start"], d.get("avg_start", 0), rp, ra)
-            o["avg_finish"] = wavg(o["avg_finish"], d.get("avg_finish", 0), rp, ra)
-            
-
+            # weighted avgs (weighted by races in each season)
+            ws[0] += safe_float(d.get("avg_incidents", 0)) * races_new
+            ws[1] += safe_float(d.get("avg_start", 0)) * races_new
+            ws[2] += safe_float(d.get("avg_finish", 0)) * races_new
             
             # Position change should be cumulative, not averaged
-            o["position_change"] = safe_float(o.get("position_change", 0)) + safe_float(d.get("position_change", 0))
+            o["position_change"] += safe_float(d.get("position_change", 0))
             
-            o["_rp"] = rp + ra
+            o["_rp"] += races_new
+    
+    # Validate calculations for debugging (only for first few drivers to avoid spam)
+    validate_names = set(sorted(out)[:3])
     
     # Calculate percentages and round averages
     for driver_name, d in out.items():
@@ -177,18 +235,209 @@ def _aggregate_career() -> dict:
             d["laps_complete_pct"] = 0.0
             d["laps_lead_pct"] = 0.0
         
-        # Validate calculations for debugging (only for first few drivers to avoid spam)
-        if len([name for name in out.keys() if name <= driver_name]) <= 3:
+        if driver_name in validate_names:
             validate_percentage_calculations(d, driver_name)
         
-        d["avg_incidents"] = round(safe_float(d["avg_incidents"]), 2)
-        d["avg_start"] = round(safe_float(d["avg_start"]), 2)
-        d["avg_finish"] = round(safe_float(d["avg_finish"]), 2)
+        rp = d["_rp"]
+        ws = wsums[driver_name]
+        d["avg_incidents"] = round(ws[0] / rp, 2) if rp > 0 else 0.0
+        d["avg_start"] = round(ws[1] / rp, 2) if rp > 0 else 0.0
+        d["avg_finish"] = round(ws[2] / rp, 2) if rp > 0 else 0.0
     
     return out
 
 def _rows_from_dataset(dataset: dict, metric: str, limit: int = None) -> list[dict]:
     """Convert dataset to rows for display, with optional limit"""
+    # Datasets come from the season/career caches, so the same dict object means
+    # unchanged data: sort once per (dataset, metric) and slice for each page.
+    key = (id(dataset), metric)
+    cached = _ROWS_CACHE.get(key)
+    if cached and cached[0] is dataset:
+        rows = cached[1]
+    elif limit and limit < len(dataset):
+        # Top-N only (e.g. the first leaderboard page): partial selection, no full sort.
+        # nlargest keeps the same order and tie-breaking as the full sort.
+        return heapq.nlargest(limit, _dataset_rows(dataset), key=_sort_key_for(metric))
+    else:
+        rows = _build_rows(dataset, metric)
+        if len(_ROWS_CACHE) >= _ROWS_CACHE_MAX:
+            _ROWS_CACHE.pop(next(iter(_ROWS_CACHE)))
+        _ROWS_CACHE[key] = (dataset, rows)
+    if limit:
+        return rows[:limit]  # Return limited results if specified
+    return rows  # Return all results if no limit specified
+
+def _page_rows(rows: list[dict], start: int, end: int) -> list[dict]:
+    """Copies of rows[start:end] tagged with their 1-based global_position (cached rows stay untouched)"""
+    return [dict(row, global_position=start + i + 1) for i, row in enumerate(rows[start:end])]
+
+# Cleaned-name variants per rows list, keyed like _ROWS_CACHE (rows lists are shared and stable)
+_NAME_KEYS_CACHE: dict[int, tuple[list, dict]] = {}
+
+class _AlphaKeepTable(dict):
+    """str.translate table keeping letters and whitespace; codepoints are classified on first sight"""
+    def __missing__(self, cp: int):
+        ch = chr(cp)
+        keep = self[cp] = cp if (ch.isalpha() or ch.isspace()) else None
+        return keep
+
+_ALPHA_KEEP = _AlphaKeepTable()
+
+def _first_index(values: list) -> dict:
+    """Map each value to the index of its first occurrence (same answer as list.index)"""
+    index = {}
+    for i, v in enumerate(values):
+        index.setdefault(v, i)
+    return index
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _build_trigram_index(names: list[str]) -> tuple[dict, list]:
+    """Trigram -> set of name indices, plus indices of names too short to have trigrams"""
+    index: dict[str, set] = {}
+    short = []
+    for i, name in enumerate(names):
+        if len(name) < 3:
+            short.append(i)
+        for tri in _trigrams(name):
+            index.setdefault(tri, set()).add(i)
+    return index, short
+
+def _contains_match(keys: dict, target: str) -> Optional[int]:
+    """
+    First row whose cleaned name contains target or is contained in it.
+    Uses the trigram index to narrow candidates; short targets fall back to a scan.
+    """
+    names = keys["clean"]
+    lens = keys["lens"]
+    tlen = len(target)
+    target_tris = _trigrams(target)
+    if not target_tris:
+        # Length gate first: a name can only contain target if it's at least as long, and vice versa
+        return next((i for i, n in enumerate(names)
+                     if (lens[i] >= tlen and target in n) or (lens[i] <= tlen and n in target)), None)
+    index = keys["trigrams"]
+    postings = [index.get(tri, set()) for tri in target_tris]
+    # Names containing target have all of its trigrams; names inside target have
+    # only trigrams of target (or none at all when shorter than 3 chars)
+    hits = [i for i in set.intersection(*postings) if target in names[i]]
+    hits.extend(i for i in set().union(*postings) if lens[i] < tlen and names[i] in target)
+    hits.extend(i for i in keys["short"] if names[i] in target)
+    return min(hits) if hits else None
+
+def _alpha_index(keys: dict) -> dict:
+    """Letters-and-spaces-only name -> first row index, built on first use and kept with the name keys"""
+    alpha_idx = keys.get("alpha_idx")
+    if alpha_idx is None:
+        alpha_idx = keys["alpha_idx"] = _first_index([n.translate(_ALPHA_KEEP) for n in keys["clean"]])
+    return alpha_idx
+
+def _fuzzy_match(keys: dict, target: str) -> Optional[int]:
+    """Row whose cleaned name is the best rapidfuzz WRatio match for target (None below FUZZY_MATCH_CUTOFF)"""
+    names = keys["clean"]
+    if not RAPIDFUZZ_AVAILABLE or not names:
+        return None
+    choices = names
+    target_tris = _trigrams(target)
+    if target_tris:
+        # Only names sharing a trigram with the target are scored; none at all is
+        # the usual "hasn't raced this season" miss, so skip scoring entirely
+        trigram_index = keys["trigrams"]
+        candidates = set().union(*(trigram_index.get(tri, ()) for tri in target_tris))
+        if not candidates:
+            return None
+        choices = {i: names[i] for i in sorted(candidates)}
+    match = fuzz_process.extractOne(target, choices, scorer=fuzz.WRatio, score_cutoff=FUZZY_MATCH_CUTOFF)
+    return match[2] if match else None
+
+def _find_me_index(rows: list[dict], iracing_name: str) -> Optional[int]:
+    """
+    Position of a linked driver in sorted rows: the first row whose name equals the
+    target (ignoring case/spaces) or contains / is contained in it, falling back to
+    the closest edit-distance match when rapidfuzz is installed.
+    """
+    keys = _name_keys(rows)
+    target = iracing_name.strip().lower()
+    hits = [i for i in (keys["nospace_idx"].get(target.replace(" ", "")),
+                        _contains_match(keys, target)) if i is not None]
+    if hits:
+        return min(hits)
+    return _fuzzy_match(keys, target)
+
+def _name_keys(rows: list[dict]) -> dict:
+    """Stripped/lowercased name variants for rows, index-aligned, built once per rows list"""
+    cached = _NAME_KEYS_CACHE.get(id(rows))
+    if cached and cached[0] is rows:
+        return cached[1]
+    clean = [row["name"].strip().lower() for row in rows]
+    nospace = [n.replace(" ", "") for n in clean]
+    keys = {
+        "clean": clean,
+        "nospace": nospace,
+        "lens": [len(n) for n in clean],
+        # variant -> first row index, for O(1) exact lookups
+        "clean_idx": _first_index(clean),
+        "nospace_idx": _first_index(nospace),
+    }
+    keys["trigrams"], keys["short"] = _build_trigram_index(clean)
+    if len(_NAME_KEYS_CACHE) >= _ROWS_CACHE_MAX:
+        _NAME_KEYS_CACHE.pop(next(iter(_NAME_KEYS_CACHE)))
+    _NAME_KEYS_CACHE[id(rows)] = (rows, keys)
+    return keys
+
+def _build_rows(dataset: dict, metric: str) -> list[dict]:
+    """Display rows for every driver, sorted best-first by metric"""
+    rows = _dataset_rows(dataset)
+    # Sort on one precomputed key column (row values are already numeric)
+    keys = list(map(_sort_key_for(metric), rows))
+    order = sorted(range(len(rows)), key=keys.__getitem__, reverse=True)
+    return [rows[i] for i in order]
+
+def _dataset_rows(dataset: dict) -> list[dict]:
+    """Unsorted display rows for dataset, materialized once and shared by every metric's ordering"""
+    key = (id(dataset), None)
+    cached = _ROWS_CACHE.get(key)
+    if cached and cached[0] is dataset:
+        return cached[1]
+    rows = _materialize_rows(dataset)
+    if len(_ROWS_CACHE) >= _ROWS_CACHE_MAX:
+        _ROWS_CACHE.pop(next(iter(_ROWS_CACHE)))
+    _ROWS_CACHE[key] = (dataset, rows)
+    return rows
+
+# "flag name" lines for the driver list, sorted by name; keyed like _ROWS_CACHE
+_DRIVER_LIST_CACHE: dict[int, tuple[dict, list[str]]] = {}
+
+def _driver_list_names(dataset: dict) -> list[str]:
+    """Flag-prefixed driver names sorted by full driver name (not by flag); shared, read-only"""
+    cached = _DRIVER_LIST_CACHE.get(id(dataset))
+    if cached and cached[0] is dataset:
+        return cached[1]
+    # Sort on the lowercased name once per driver, then keep only the formatted strings
+    driver_entries = sorted(((name.lower(), f"{flag_shortcode(d.get('country') or '')} {name}")
+                             for name, d in dataset.items()), key=lambda e: e[0])
+    names = [entry[1] for entry in driver_entries]
+    if len(_DRIVER_LIST_CACHE) >= _ROWS_CACHE_MAX:
+        _DRIVER_LIST_CACHE.pop(next(iter(_DRIVER_LIST_CACHE)))
+    _DRIVER_LIST_CACHE[id(dataset)] = (dataset, names)
+    return names
+
+# "N. flag name" display lines per cached driver-list names list
+_DRIVER_LINES_CACHE: dict[int, tuple[list[str], list[str]]] = {}
+
+def _numbered_lines(names: list[str]) -> list[str]:
+    """names prefixed with their 1-based list position, built once per names list"""
+    cached = _DRIVER_LINES_CACHE.get(id(names))
+    if cached and cached[0] is names:
+        return cached[1]
+    lines = [f"{i}. {n}" for i, n in enumerate(names, 1)]
+    if len(_DRIVER_LINES_CACHE) >= _ROWS_CACHE_MAX:
+        _DRIVER_LINES_CACHE.pop(next(iter(_DRIVER_LINES_CACHE)))
+    _DRIVER_LINES_CACHE[id(names)] = (names, lines)
+    return lines
+
+def _materialize_rows(dataset: dict) -> list[dict]:
     rows = []
     for name, d in dataset.items():
         races = int(d.get("races") or 0)
@@ -251,11 +500,7 @@ def _rows_from_dataset(dataset: dict, metric: str, limit: int = None) -> list[di
             "race_distances": race_distances,
             "position_change": safe_float(d.get("position_change")),
         })
-    
-    rows.sort(key=lambda r: _sort_key(metric, r), reverse=True)
-    if limit:
-        return rows[:limit]  # Return limited results if specified
-    return rows  # Return all results if no limit specified
+    return rows
 
 DATA_ROOT = os.path.join(os.path.dirname(__file__), "data")
 SEASONS_DIR = os.path.join(DATA_ROOT, "seasons")
@@ -266,6 +511,9 @@ BACKUP_INTERVAL_HOURS = 24      # auto backup cadence in hours
 BACKUP_INTERVAL_DAYS = 7        # days between backups
 RETENTION_DAYS = 30             # days to keep old backups
 PAGE_SIZE = 20                  # drivers list pagination size
+FUZZY_MATCH_CUTOFF = 85         # minimum rapidfuzz WRatio score for a Find Me fuzzy match
+SUGGESTION_CUTOFF = 70          # minimum rapidfuzz WRatio score for a "potential match" hint
+DEBUG_FIND_ME = False           # verbose name-matching logs for Find Me
 UPLOADS_STORE_DIR = os.path.join(DATA_ROOT, "uploads")
 
 os.makedirs(DATA_ROOT, exist_ok=True)
@@ -273,6 +521,19 @@ os.makedirs(SEASONS_DIR, exist_ok=True)
 os.makedirs(BACKUPS_DIR, exist_ok=True)
 os.makedirs(UPLOADS_STORE_DIR, exist_ok=True)
 
+# ========= JSON helpers (orjson when installed, stdlib json otherwise) =========
+def json_loads(raw):
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def json_dumps_bytes(obj) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
 # ========= Config I/O =========
 def load_config() -> Dict:
     if not os.path.exists(CONFIG_FILE):
@@ -289,20 +550,54 @@ def load_config() -> Dict:
                     "folder_id": None,
                     "auto_backup": True
                 },
+                "backups": {"method": "ZIP_DEFLATED", "compression_level": 1},
                 "discord_links": {}
             }, f, indent=2)
-    with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(CONFIG_FILE, "rb") as f:
+        return json_loads(f.read())
+
+# Set whenever config changes; flush_config() persists it in the background
+_config_dirty = asyncio.Event()
+
+def _write_config_bytes(data: bytes) -> None:
+    """Write serialized config atomically: dump to a temp file, then swap it into place"""
+    tmp = CONFIG_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, CONFIG_FILE)
 
 def save_config(cfg: Dict) -> None:
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2)
+    """Mark config as changed; the write is coalesced by flush_config()"""
+    _config_dirty.set()
+
+def flush_config_now() -> None:
+    """Synchronously write pending config changes (used at shutdown)"""
+    if _config_dirty.is_set():
+        _config_dirty.clear()
+        _write_config_bytes(json_dumps_bytes(config))
 
 # ========= Discord-iRacing Link Management =========
+# Reverse index: normalized iRacing name (lowercase, no spaces) -> Discord ID
+_iracing_to_discord: Dict[str, int] = {}
+# (stripped lowercase iRacing name, Discord ID) per link, in config order, for substring fallbacks
+_link_names: List[Tuple[str, int]] = []
+
+def _link_key(name: str) -> str:
+    return name.strip().lower().replace(" ", "")
+
+def _rebuild_link_index() -> None:
+    """Rebuild the reverse link index from config (first link wins on collisions)"""
+    _iracing_to_discord.clear()
+    _link_names.clear()
+    for discord_id, name in config.get("discord_links", {}).items():
+        _iracing_to_discord.setdefault(_link_key(name), int(discord_id))
+        _link_names.append((name.strip().lower(), int(discord_id)))
+
 def link_discord_to_iracing(discord_id: int, iracing_name: str) -> bool:
     """Link a Discord user ID to an iRacing driver name"""
     try:
         config.setdefault("discord_links", {})[str(discord_id)] = iracing_name
+        _rebuild_link_index()
         save_config(config)
         return True
     except Exception:
@@ -313,6 +608,7 @@ def unlink_discord(discord_id: int) -> bool:
     try:
         if "discord_links" in config and str(discord_id) in config["discord_links"]:
             del config["discord_links"][str(discord_id)]
+            _rebuild_link_index()
             save_config(config)
             return True
         return False
@@ -325,17 +621,20 @@ def get_iracing_name(discord_id: int) -> Optional[str]:
 
 def get_discord_id(iracing_name: str) -> Optional[int]:
     """Get Discord ID for an iRacing driver name"""
+    # Exact and space-insensitive matches come straight from the index
+    discord_id = _iracing_to_discord.get(_link_key(iracing_name))
+    if discord_id is not None:
+        return discord_id
+    # Fall back to substring matching; an index miss already rules out exact and
+    # space-insensitive equality, so only the containment checks remain
     iracing_name_clean = iracing_name.strip().lower()
-    for discord_id, name in config.get("discord_links", {}).items():
-        name_clean = name.strip().lower()
-        # Enhanced matching for discord links
-        if (name_clean == iracing_name_clean or
-            name_clean.replace(" ", "") == iracing_name_clean.replace(" ", "") or
-            iracing_name_clean in name_clean or name_clean in iracing_name_clean):
-            return int(discord_id)
+    for name_clean, discord_id in _link_names:
+        if iracing_name_clean in name_clean or name_clean in iracing_name_clean:
+            return discord_id
     return None
 
 config = load_config()
+_rebuild_link_index()
 TOKEN = config.get("token") or ""
 GUILD_IDS_RAW = config.get("guild_ids", [])
 GUILD_IDS = [int(gid) for gid in GUILD_IDS_RAW if str(gid).isdigit()]
@@ -420,15 +719,7 @@ async def backup_to_google_drive(backup_path: str) -> bool:
     folder_id = gdrive_config.get("folder_id")
     
     # Run the upload in a thread to avoid blocking the event loop
-    import threading
-    import asyncio
-    
-    def upload_task():
-        return upload_to_google_drive(backup_path, folder_id)
-    
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(None, upload_task)
-    return result
+    return await asyncio.to_thread(upload_to_google_drive, backup_path, folder_id)
 
 async def auto_sync_stats_after_change(affected_seasons: list[str]):
     """
@@ -474,10 +765,33 @@ def check_channel_restriction(interaction: discord.Interaction) -> bool:
     return interaction.channel_id == RESTRICTED_CHANNEL_ID
 
 # ========= Utilities: seasons & store =========
+# Sorted season names, validated against the seasons directory's mtime_ns
+_SEASON_LIST_CACHE: dict[str, tuple[int, List[str]]] = {}
+
 def list_seasons() -> List[str]:
-    if not os.path.exists(SEASONS_DIR):
+    try:
+        mtime_ns = os.stat(SEASONS_DIR).st_mtime_ns
+    except FileNotFoundError:
         return []
-    return sorted([d for d in os.listdir(SEASONS_DIR) if os.path.isdir(os.path.join(SEASONS_DIR, d))])
+    cached = _SEASON_LIST_CACHE.get(SEASONS_DIR)
+    if cached and cached[0] == mtime_ns:
+        return list(cached[1])
+    # scandir reports the entry type with each name, so no isdir() stat per entry
+    with os.scandir(SEASONS_DIR) as it:
+        seasons = sorted(e.name for e in it if e.is_dir())
+    _SEASON_LIST_CACHE[SEASONS_DIR] = (mtime_ns, seasons)
+    return list(seasons)
+
+def _season_signature() -> tuple:
+    """(season, drivers.json mtime_ns, size) for every season; changes whenever a season file does"""
+    sig = []
+    for s in list_seasons():
+        try:
+            st = os.stat(os.path.join(SEASONS_DIR, s, "drivers.json"))
+            sig.append((s, st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            sig.append((s, None, None))
+    return tuple(sig)
 
 def ensure_season_dir(season: str) -> str:
     p = os.path.join(SEASONS_DIR, season)
@@ -487,20 +801,54 @@ def ensure_season_dir(season: str) -> str:
 def season_drivers_path(season: str) -> str:
     return os.path.join(ensure_season_dir(season), "drivers.json")
 
-def load_season_drivers(season: str) -> Dict[str, Dict]:
+# Parsed drivers.json per path, validated against the file's mtime_ns
+_SEASON_CACHE: dict[str, tuple[int, dict]] = {}
+
+def load_season_drivers(season: str, writable: bool = False) -> Dict[str, Dict]:
+    """
+    Load a season's drivers map, served from cache while the file is unchanged.
+    The cached dict is shared; pass writable=True to get a private copy to mutate.
+    """
     p = season_drivers_path(season)
-    if not os.path.exists(p):
+    try:
+        mtime_ns = os.stat(p).st_mtime_ns
+    except FileNotFoundError:
+        _SEASON_CACHE.pop(p, None)
         return {}
-    with open(p, "r", encoding="utf-8") as f:
-        return json.load(f)
+    cached = _SEASON_CACHE.get(p)
+    if cached and cached[0] == mtime_ns:
+        data = cached[1]
+    else:
+        with open(p, "rb") as f:
+            data = json_loads(f.read())
+        _SEASON_CACHE[p] = (mtime_ns, data)
+    return copy.deepcopy(data) if writable else data
 
 def save_season_drivers(season: str, data: Dict[str, Dict]) -> None:
     p = season_drivers_path(season)
-    with open(p, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    with open(p, "wb") as f:
+        f.write(json_dumps_bytes(data))
+    # Keep the cache in step with what was just written
+    _SEASON_CACHE[p] = (os.stat(p).st_mtime_ns, data)
+    _CAREER_CACHE.clear()
 
+def _resolve_dataset(season_choice: Optional[str]) -> tuple[Optional[str], str, Dict[str, Dict]]:
+    """
+    Resolve a view's season choice to (season_choice, label, data).
+    No choice means the latest season; data comes from the season/career caches.
+    """
+    if season_choice == "__CAREER__":
+        return season_choice, "All Time", _aggregate_career()
+    if not season_choice:
+        ss = list_seasons()
+        season_choice = ss[-1] if ss else None
+    if not season_choice:
+        return None, "All Time", {}
+    return season_choice, season_choice, load_season_drivers(season_choice)
+
+@functools.lru_cache(maxsize=512)
 def flag_shortcode(cc: str) -> str:
-    """Convert country code to Unicode flag emoji"""
+    """Convert country code to Unicode flag emoji (memoized; only a few hundred codes exist)"""
     cc = (cc or "").strip().lower()
     if not cc or len(cc) != 2:
         return "🏁"  # Checkered flag for unknown/invalid country
@@ -521,6 +869,11 @@ def flag_shortcode(cc: str) -> str:
         return "🏁"  # Fallback to checkered flag on any error
 
 def safe_float(x, default: float = 0.0) -> float:
+    # Stored stats are almost always floats already, and missing fields come through as None
+    if type(x) is float:
+        return x
+    if x is None:
+        return default
     try:
         return float(x)
     except Exception:
@@ -579,156 +932,335 @@ async def send_to_logs(embed: discord.Embed) -> None:
     except Exception as e:
         print(console_safe(f"⚠️ Could not send to logs channel: {e}"))
 
+# Newest-first upload listing, validated against the uploads directory's mtime_ns
+_UPLOADS_LIST_CACHE: dict[str, tuple[int, list[str]]] = {}
+
 def list_uploaded_jsons() -> list[str]:
     """List all uploaded JSON files in the uploads directory"""
-    files = []
-    for fn in os.listdir(UPLOADS_STORE_DIR):
-        if fn.lower().endswith(".json"):
-            files.append(fn)
+    # Uploads are only ever added or removed (never rewritten), which bumps the directory mtime
+    mtime_ns = os.stat(UPLOADS_STORE_DIR).st_mtime_ns
+    cached = _UPLOADS_LIST_CACHE.get(UPLOADS_STORE_DIR)
+    if cached and cached[0] == mtime_ns:
+        return list(cached[1])
+    # scandir hands back the stat with each entry, so no extra stat per file for the sort
+    with os.scandir(UPLOADS_STORE_DIR) as it:
+        entries = [(e.name, e.stat().st_mtime) for e in it
+                   if e.is_file() and e.name.lower().endswith(".json") and not e.name.startswith(".")]  # skip the hash index
     # sort by mtime desc
-    files.sort(key=lambda fn: os.path.getmtime(os.path.join(UPLOADS_STORE_DIR, fn)), reverse=True)
-    return files
+    entries.sort(key=lambda e: e[1], reverse=True)
+    files = [name for name, _ in entries]
+    _UPLOADS_LIST_CACHE[UPLOADS_STORE_DIR] = (mtime_ns, files)
+    return list(files)
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+def _write_bytes(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+# Tagged into the persisted hash index so switching algorithms forces a rehash
+UPLOAD_HASH_ALGORITHM = "xxh3_64" if XXHASH_AVAILABLE else "sha256"
 
 def _generate_content_hash(content: bytes) -> str:
-    """Generate a SHA-256 hash of the JSON content for duplicate detection."""
-    import hashlib
+    """Generate a hash of the JSON content for duplicate detection (xxh3 when available, else SHA-256)."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(content)
     return hashlib.sha256(content).hexdigest()[:16]  # Use first 16 chars for readability
 
-def _is_duplicate_json(content: bytes) -> tuple[bool, str]:
+MMAP_HASH_MIN_BYTES = 2 * 1024 * 1024  # smaller uploads are hashed from a single read
+
+def _hash_file(path: str) -> str:
+    """Content hash of a file on disk; large files are hashed straight from a read-only memory map."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_HASH_MIN_BYTES:
+            return _generate_content_hash(f.read())  # one read beats mapping setup (and empty files can't be mapped)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)  # one front-to-back pass: read ahead aggressively
+            digest = _generate_content_hash(mm)
+        if hasattr(os, "posix_fadvise"):
+            # Startup rehash touches every upload once; don't let it crowd the page cache
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        return digest
+
+def _hash_file_or_none(path: str) -> Optional[str]:
+    try:
+        return _hash_file(path)
+    except Exception:
+        return None
+
+# Content hash -> uploaded filename, persisted next to the uploads
+UPLOAD_HASH_INDEX_FILE = os.path.join(UPLOADS_STORE_DIR, ".hash_index.json")
+_upload_hash_index: dict[str, str] = {}
+
+def _save_upload_hash_index() -> None:
+    try:
+        with open(UPLOAD_HASH_INDEX_FILE, "wb") as f:
+            f.write(json_dumps_bytes({"algorithm": UPLOAD_HASH_ALGORITHM, "hashes": _upload_hash_index}))
+    except Exception as e:
+        print(console_safe(f"⚠️ Could not save upload hash index: {e}"))
+
+def _load_upload_hash_index() -> None:
+    """Load the persisted hash index and reconcile it with the uploads directory."""
+    try:
+        with open(UPLOAD_HASH_INDEX_FILE, "rb") as f:
+            stored = json_loads(f.read())
+    except (FileNotFoundError, ValueError):
+        stored = {}
+    # Hashes from another algorithm (or the old untagged format) can't be compared; rehash everything
+    saved = stored.get("hashes", {}) if stored.get("algorithm") == UPLOAD_HASH_ALGORITHM else {}
+    
+    files = list_uploaded_jsons()
+    present = set(files)
+    _upload_hash_index.clear()
+    _upload_hash_index.update({h: fn for h, fn in saved.items() if fn in present})
+    
+    # Hash only the files the saved index doesn't know about, a few at a time
+    # (hashlib releases the GIL on large buffers)
+    indexed = set(_upload_hash_index.values())
+    unknown = [fn for fn in files if fn not in indexed]
+    if unknown:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            hashes = pool.map(_hash_file_or_none, [os.path.join(UPLOADS_STORE_DIR, fn) for fn in unknown])
+            for filename, content_hash in zip(unknown, hashes):
+                if content_hash is not None:
+                    _upload_hash_index.setdefault(content_hash, filename)
+    
+    if _upload_hash_index != saved or stored.get("algorithm") != UPLOAD_HASH_ALGORITHM:
+        _save_upload_hash_index()
+
+def _index_upload(filename: str, content: bytes, content_hash: Optional[str] = None) -> None:
+    """Record a newly stored upload in the hash index (pass content_hash if already computed)."""
+    _upload_hash_index[content_hash or _generate_content_hash(content)] = filename
+    _save_upload_hash_index()
+
+def _unindex_uploads(filenames: list[str]) -> None:
+    """Drop deleted uploads from the hash index."""
+    gone = set(filenames)
+    stale = [h for h, fn in _upload_hash_index.items() if fn in gone]
+    for h in stale:
+        del _upload_hash_index[h]
+    if stale:
+        _save_upload_hash_index()
+
+def _stored_upload_matches(filename: str, content: bytes) -> Optional[bool]:
+    """
+    Whether a stored upload holds exactly this content; None if the file is gone.
+    File I/O only (safe to run in a worker thread) - never touches the hash index.
+    """
+    path = os.path.join(UPLOADS_STORE_DIR, filename)
+    if not os.path.exists(path):
+        return None
+    # xxh3 isn't collision resistant, so confirm the match byte-for-byte (size check first)
+    if XXHASH_AVAILABLE and (os.path.getsize(path) != len(content) or _read_bytes(path) != content):
+        return False
+    return True
+
+async def _is_duplicate_json(content: bytes, content_hash: Optional[str] = None) -> tuple[bool, str]:
     """
     Check if JSON content is a duplicate of an existing file.
     Returns (is_duplicate, existing_filename).
     """
-    content_hash = _generate_content_hash(content)
+    # Hashing and file reads run in a worker thread; the index is only read,
+    # mutated and saved here on the event loop
+    content_hash = content_hash or await asyncio.to_thread(_generate_content_hash, content)
+    filename = _upload_hash_index.get(content_hash)
+    if filename is None:
+        return False, ""
+    matches = await asyncio.to_thread(_stored_upload_matches, filename, content)
+    if matches is None:
+        # File was removed outside the bot; forget it
+        _unindex_uploads([filename])
+        return False, ""
+    return (True, filename) if matches else (False, "")
+
+_load_upload_hash_index()
+
+def _deleted_races(file_content: bytes) -> dict[str, dict]:
+    """Per-driver race details (finish, start, incidents, points) from an uploaded event_result"""
+    data = json_loads(file_content)
+    race_data = data.get("data", {})
+    sessions = race_data.get("session_results", [])
+    
+    # Find RACE session
+    race_sessions = [s for s in sessions if str(s.get("simsession_name", "")).upper() == "RACE"]
+    if not race_sessions:
+        return {}
+    
+    results = race_sessions[0].get("results", []) or []
     
-    # Check existing files for matching content
-    for filename in os.listdir(UPLOADS_STORE_DIR):
-        if not filename.lower().endswith(".json"):
+    # Extract driver names and race details from the deleted file
+    deleted_races = {}
+    for row in results:
+        name = str(row.get("display_name") or "").strip()
+        if not name:
             continue
         
-        file_path = os.path.join(UPLOADS_STORE_DIR, filename)
-        try:
-            with open(file_path, "rb") as f:
-                existing_content = f.read()
-                if _generate_content_hash(existing_content) == content_hash:
-                    return True, filename
-        except Exception:
-            continue
-    
-    return False, ""
-
-async def _remove_ingested_data(file_content: bytes) -> list[str]:
-    """
-    Remove ingested data from seasons when a JSON file is deleted.
-    Returns list of season names that were affected.
-    """
-    try:
-        # Parse the JSON content to extract race data
-        data = json.loads(file_content.decode("utf-8"))
-        race_data = data.get("data", {})
-        sessions = race_data.get("session_results", [])
+        # Get race details for reversal
+        fin_1 = None
+        if (fp := row.get("finish_position")) is not None and isinstance(fp, int) and fp >= 0:
+            fin_1 = fp + 1
         
-        # Find RACE session
-        race_sessions = [s for s in sessions if str(s.get("simsession_name", "")).upper() == "RACE"]
-        if not race_sessions:
-            return []
+        start_1 = None
+        sp = row.get("starting_position")
+        if sp is not None and isinstance(sp, int) and sp >= 0:
+            start_1 = sp + 1
         
-        results = race_sessions[0].get("results", []) or []
-        if not results:
-            return []
+        inc = float(row.get("incidents", 0) or 0)
+        pts = float(row.get("champ_points", 0) or 0)
         
-        # Extract driver names and race details from the deleted file
-        deleted_races = {}
-        for row in results:
-            name = str(row.get("display_name") or "").strip()
-            if not name:
-                continue
+        deleted_races[name] = {
+            "finish": fin_1,
+            "start": start_1,
+            "incidents": inc,
+            "points": pts
+        }
+    return deleted_races
+
+def _reverse_races(drivers_data: Dict[str, Dict], deleted_races: dict[str, dict]) -> bool:
+    """Subtract one file's races from a (writable) season map; True if anything changed"""
+    season_modified = False
+    for driver_name, race_info in deleted_races.items():
+        if driver_name in drivers_data:
+            driver = drivers_data[driver_name]
+            finish = race_info["finish"]
             
-            # Get race details for reversal
-            fin_1 = None
-            if (fp := row.get("finish_position")) is not None and isinstance(fp, int) and fp >= 0:
-                fin_1 = fp + 1
+            # Reverse the race data
+            if driver.get("races", 0) > 0:
+                driver["races"] = max(0, driver.get("races", 0) - 1)
+                season_modified = True
             
-            start_1 = None
-            sp = row.get("starting_position")
-            if sp is not None and isinstance(sp, int) and sp >= 0:
-                start_1 = sp + 1
+            # Reverse wins
+            if finish == 1 and driver.get("wins", 0) > 0:
+                driver["wins"] = max(0, driver.get("wins", 0) - 1)
+                season_modified = True
             
-            inc = float(row.get("incidents", 0) or 0)
-            pts = float(row.get("champ_points", 0) or 0)
+            # Reverse poles
+            if race_info["start"] == 1 and driver.get("poles", 0) > 0:
+                driver["poles"] = max(0, driver.get("poles", 0) - 1)
+                season_modified = True
             
-            deleted_races[name] = {
-                "finish": fin_1,
-                "start": start_1,
-                "incidents": inc,
-                "points": pts
-            }
-        
-        if not deleted_races:
-            return []
-        
-        # Check all seasons for this data and remove it
-        affected_seasons = []
+            # Reverse other stats (no finish position means no podium/top 10 to take back)
+            if driver.get("podiums", 0) > 0 and finish is not None and finish <= 3:
+                driver["podiums"] = max(0, driver.get("podiums", 0) - 1)
+                season_modified = True
+            
+            if driver.get("top10s", 0) > 0 and finish is not None and finish <= 10:
+                driver["top10s"] = max(0, driver.get("top10s", 0) - 1)
+                season_modified = True
+            
+            # Reverse points and incidents
+            if driver.get("points", 0) > 0:
+                driver["points"] = max(0, driver.get("points", 0) - race_info["points"])
+                season_modified = True
+            
+            if driver.get("incidents", 0) > 0:
+                driver["incidents"] = max(0, driver.get("incidents", 0) - race_info["incidents"])
+                season_modified = True
+    return season_modified
+
+async def _remove_ingested_data_bulk(contents: list[bytes]) -> list[list[str]]:
+    """
+    Remove the ingested data of several deleted JSON files in one pass.
+    Each season is loaded and saved at most once; returns the affected seasons per file.
+    """
+    per_file: list[dict[str, dict]] = []
+    for file_content in contents:
+        try:
+            per_file.append(_deleted_races(file_content))
+        except Exception as e:
+            print(console_safe(f"❌ Error removing ingested data: {e}"))
+            per_file.append({})
+    
+    affected: list[list[str]] = [[] for _ in contents]
+    deleted_names = set().union(*per_file)
+    if not deleted_names:
+        return affected
+    
+    # Check all seasons for this data and remove it
+    for season in list_seasons():
+        season_path = season_drivers_path(season)
+        if not os.path.exists(season_path):
+            continue
         
-        for season in list_seasons():
-            season_path = season_drivers_path(season)
-            if not os.path.exists(season_path):
+        try:
+            # Skip seasons none of these drivers raced in (cached read, no copy)
+            if deleted_names.isdisjoint(load_season_drivers(season)):
                 continue
+            drivers_data = load_season_drivers(season, writable=True)
+            season_modified = False
             
-            try:
-                drivers_data = load_season_drivers(season)
-                season_modified = False
-                
-                for driver_name, race_info in deleted_races.items():
-                    if driver_name in drivers_data:
-                        driver = drivers_data[driver_name]
-                        
-                        # Reverse the race data
-                        if driver.get("races", 0) > 0:
-                            driver["races"] = max(0, driver.get("races", 0) - 1)
-                            season_modified = True
-                        
-                        # Reverse wins
-                        if race_info["finish"] == 1 and driver.get("wins", 0) > 0:
-                            driver["wins"] = max(0, driver.get("wins", 0) - 1)
-                            season_modified = True
-                        
-                        # Reverse poles
-                        if race_info["start"] == 1 and driver.get("poles", 0) > 0:
-                            driver["poles"] = max(0, driver.get("poles", 0) - 1)
-                            season_modified = True
-                        
-                        # Reverse other stats
-                        if driver.get("podiums", 0) > 0 and race_info["finish"] <= 3:
-                            driver["podiums"] = max(0, driver.get("podiums", 0) - 1)
-                            season_modified = True
-                        
-                        if driver.get("top10s", 0) > 0 and race_info["finish"] <= 10:
-                            driver["top10s"] = max(0, driver.get("top10s", 0) - 1)
-                            season_modified = True
-                        
-                        # Reverse points and incidents
-                        if driver.get("points", 0) > 0:
-                            driver["points"] = max(0, driver.get("points", 0) - race_info["points"])
-                            season_modified = True
-                        
-                        if driver.get("incidents", 0) > 0:
-                            driver["incidents"] = max(0, driver.get("incidents", 0) - race_info["incidents"])
-                            season_modified = True
+            # Apply the files in order, so each reversal sees the previous ones
+            for i, deleted_races in enumerate(per_file):
+                if deleted_races and _reverse_races(drivers_data, deleted_races):
+                    affected[i].append(season)
+                    season_modified = True
+            
+            if season_modified:
+                save_season_drivers(season, drivers_data)
                 
-                if season_modified:
-                    save_season_drivers(season, drivers_data)
-                    affected_seasons.append(season)
-                    
-            except Exception as e:
-                print(console_safe(f"⚠️ Error processing season {season}: {e}"))
-                continue
-        
-        return affected_seasons
-        
-    except Exception as e:
-        print(console_safe(f"❌ Error removing ingested data: {e}"))
-        return []
+        except Exception as e:
+            print(console_safe(f"⚠️ Error processing season {season}: {e}"))
+            for seasons in affected:
+                if seasons and seasons[-1] == season:
+                    seasons.pop()  # nothing was saved for this season
+            continue
+    
+    return affected
+
+async def _remove_ingested_data(file_content: bytes) -> list[str]:
+    """
+    Remove ingested data from seasons when a JSON file is deleted.
+    Returns list of season names that were affected.
+    """
+    return (await _remove_ingested_data_bulk([file_content]))[0]
+
+async def _delete_uploads(filenames: list[str]) -> tuple[int, set, list[str]]:
+    """
+    Delete stored uploads and reverse their ingested data with one pass over the seasons.
+    Returns (files deleted, seasons affected, per-file result lines).
+    """
+    results: dict[str, str] = {}
+    pending: list[tuple[str, str, bytes]] = []
+    for filename in filenames:
+        path = os.path.join(UPLOADS_STORE_DIR, filename)
+        if not os.path.exists(path):
+            results[filename] = f"⚠️ `{filename}`: Already deleted"
+            continue
+        try:
+            # File I/O runs off the event loop so large uploads don't stall the gateway
+            pending.append((filename, path, await asyncio.to_thread(_read_bytes, path)))
+        except Exception as e:
+            results[filename] = f"❌ `{filename}`: Failed - {e}"
+    
+    total_deleted = 0
+    total_seasons_affected = set()
+    seasons_per_file = await _remove_ingested_data_bulk([content for _, _, content in pending])
+    for (filename, path, _), seasons_affected in zip(pending, seasons_per_file):
+        try:
+            await asyncio.to_thread(os.remove, path)
+            _unindex_uploads([filename])
+            total_seasons_affected.update(seasons_affected)
+            total_deleted += 1
+            
+            if seasons_affected:
+                results[filename] = f"✅ `{filename}`: Deleted, data removed from {len(seasons_affected)} season(s)"
+            else:
+                results[filename] = f"✅ `{filename}`: Deleted (no ingested data)"
+        except Exception as e:
+            results[filename] = f"❌ `{filename}`: Failed - {e}"
+    
+    return total_deleted, total_seasons_affected, [results[f] for f in filenames]
+
+def _delete_summary(title: str, files_processed: int, total_deleted: int, seasons_affected: set, results: list[str]) -> str:
+    """Summary message for a delete run, built in one join"""
+    parts = [title, "", f"📁 **Files processed:** {files_processed}", f"🗑 **Successfully deleted:** {total_deleted}"]
+    if seasons_affected:
+        parts.append(f"📊 **Seasons affected:** {', '.join(sorted(seasons_affected))}")
+    parts += ["", "**Results:**", "\n".join(results)]
+    return "\n".join(parts)
 
 def _sanitize_filename(name: str) -> str:
     """Sanitize a filename to be safe for filesystem operations"""
@@ -751,11 +1283,11 @@ def set_current_season(name: Optional[str]):
     save_config(config)
 
 # ========= Ingest: iRacing JSON (event_result) =========
-def process_json_into_season(file_content: str, season: str) -> bool:
+def process_json_into_season(file_content: bytes, season: str) -> bool:
     """Process a JSON file content into a season and return success status"""
     try:
         # Parse the JSON content
-        data = json.loads(file_content)
+        data = json_loads(file_content)
         
         # Ensure the season directory exists
         ensure_season_dir(season)
@@ -769,6 +1301,25 @@ def process_json_into_season(file_content: str, season: str) -> bool:
         print(f"Error processing JSON into season {season}: {e}")
         return False
 
+def _wavg(prev, add, rp: int, ra: int) -> float:
+    """Running average: fold `ra` samples of `add` into `rp` prior samples averaging `prev`"""
+    prev = safe_float(prev)
+    add = safe_float(add)
+    tot = rp + ra
+    return (prev * rp + add * ra) / tot if tot > 0 else 0.0
+
+def _race_distance(race_results: list) -> int:
+    """Winner's lap count for a race, falling back to the most laps completed"""
+    for row in race_results:
+        if row.get("finish_position", -1) == 0:  # Winner (0-indexed in iRacing)
+            distance = int(row.get("laps_complete", 0) or 0)
+            break
+    else:
+        distance = 0
+    if distance == 0:
+        distance = max((int(r.get("laps_complete", 0) or 0) for r in race_results), default=0)
+    return distance
+
 def ingest_iracing_event(payload: Dict, season: str) -> Tuple[int, int]:
     """
     Parse iRacing event_result JSON for the RACE session and update season stats.
@@ -794,7 +1345,19 @@ def ingest_iracing_event(payload: Dict, season: str) -> Tuple[int, int]:
         if name:
             qual_lookup[name] = qual_row
     
-    drivers_map = load_season_drivers(season)
+    drivers_map = load_season_drivers(season, writable=True)
+
+    # Per-race values shared by every row, computed once instead of rescanning results per driver
+    race_distance = _race_distance(race_results)
+    fastest_lap_in_race = min(
+        (bl for r in race_results if (bl := r.get("best_lap_time", -1)) > 0), default=float('inf'))
+    weather_data = race_sessions[0].get("weather_result", {})
+    weather_entry = {
+        "temp": weather_data.get("avg_temp", 0),
+        "humidity": weather_data.get("avg_rel_humidity", 0),
+        "wind": weather_data.get("avg_wind_speed", 0),
+        "clouds": weather_data.get("avg_cloud_cover_pct", 0)
+    } if weather_data else None
 
     updated = 0
     processed = 0
@@ -830,15 +1393,17 @@ def ingest_iracing_event(payload: Dict, season: str) -> Tuple[int, int]:
         inc = float(row.get("incidents", 0) or 0)
         pts = float(row.get("champ_points", 0) or 0)
 
-        d = drivers_map.setdefault(name, {
-            "country": country, "races": 0, "wins": 0, "podiums": 0, "top10s": 0, "poles": 0,
-            "points": 0.0, "avg_incidents": 0.0, "avg_start": 0.0, "avg_finish": 0.0, "_rp": 0,
-            "laps_complete": 0, "laps_lead": 0, "fastest_laps": 0,
-            "position_change": 0.0,
-            # Data tracking for calculations
-            "lap_times": [], "position_changes": [], "weather_conditions": []
-        })
-        if country and not d.get("country"):
+        d = drivers_map.get(name)
+        if d is None:
+            d = drivers_map[name] = {
+                "country": country, "races": 0, "wins": 0, "podiums": 0, "top10s": 0, "poles": 0,
+                "points": 0.0, "avg_incidents": 0.0, "avg_start": 0.0, "avg_finish": 0.0, "_rp": 0,
+                "laps_complete": 0, "laps_lead": 0, "fastest_laps": 0,
+                "position_change": 0.0,
+                # Data tracking for calculations
+                "lap_times": [], "position_changes": [], "weather_conditions": []
+            }
+        elif country and not d.get("country"):
             d["country"] = country
 
         # increment races
@@ -856,110 +1421,65 @@ def ingest_iracing_event(payload: Dict, season: str) -> Tuple[int, int]:
                 d["top10s"] = current_top10s + 1
 
         # poles (starting position 1 = pole position)
-        if start_1 is not None and start_1 == 1:
+        if start_1 == 1:
             d["poles"] = int(d.get("poles", 0)) + 1
 
         # running weighted averages by race count
         rp = int(d.get("_rp", 0))
         ra = 1
 
-        def wavg(prev, add, rp_, ra_):
-            prev = safe_float(prev)
-            add = safe_float(add)
-            tot = rp_ + ra_
-            return (prev * rp_ + add * ra_) / tot if tot > 0 else 0.0
-
         if fin_1 is not None:
-            d["avg_finish"] = wavg(d.get("avg_finish", 0), fin_1, rp, ra)
+            d["avg_finish"] = _wavg(d.get("avg_finish", 0), fin_1, rp, ra)
         if start_1 is not None:
-            d["avg_start"] = wavg(d.get("avg_start", 0), start_1, rp, ra)
-        d["avg_incidents"] = wavg(d.get("avg_incidents", 0), inc, rp, ra)
+            d["avg_start"] = _wavg(d.get("avg_start", 0), start_1, rp, ra)
+        d["avg_incidents"] = _wavg(d.get("avg_incidents", 0), inc, rp, ra)
 
-        # Extract lap-related data
-        laps_complete = int(row.get("laps_complete", 0) or 0)
-        laps_lead = int(row.get("laps_lead", 0) or 0)
-        
         # Update lap stats
-        d["laps_complete"] = int(d.get("laps_complete", 0)) + laps_complete
-        d["laps_lead"] = int(d.get("laps_lead", 0)) + laps_lead
+        d["laps_complete"] = int(d.get("laps_complete", 0)) + int(row.get("laps_complete", 0) or 0)
+        d["laps_lead"] = int(d.get("laps_lead", 0)) + int(row.get("laps_lead", 0) or 0)
         
         # Track race distances for each individual race this driver participated in
-        if "race_distances" not in d:
-            d["race_distances"] = []
-        
-        # Find the winner's lap count for this specific race to determine race distance
-        race_distance = 0
-        for other_row in race_results:
-            other_finish = other_row.get("finish_position", -1)
-            if other_finish == 0:  # Winner (0-indexed in iRacing)
-                race_distance = int(other_row.get("laps_complete", 0) or 0)
-                break
-        
-        # If no winner found, use max laps completed as fallback
-        if race_distance == 0:
-            race_distance = max((int(r.get("laps_complete", 0) or 0) for r in race_results), default=0)
-        
-        # Add this race's distance to the driver's list
+        race_distances = d.setdefault("race_distances", [])
         if race_distance > 0:
-            d["race_distances"].append(race_distance)
+            race_distances.append(race_distance)
         
-        # Check if this driver had the fastest lap in this race
-        # We'll need to compare with other drivers' best lap times
+        # Fastest lap of the race (computed once above)
         best_lap_time = row.get("best_lap_time", -1)
-        if best_lap_time > 0:  # Valid lap time
-            # Find the fastest lap time across all drivers in this race
-            fastest_lap_in_race = float('inf')
-            for other_row in race_results:
-                other_best = other_row.get("best_lap_time", -1)
-                if other_best > 0:
-                    fastest_lap_in_race = min(fastest_lap_in_race, other_best)
-            
-            # If this driver had the fastest lap, increment their count
-            if best_lap_time == fastest_lap_in_race:
-                d["fastest_laps"] = int(d.get("fastest_laps", 0)) + 1
+        if best_lap_time > 0 and best_lap_time == fastest_lap_in_race:
+            d["fastest_laps"] = int(d.get("fastest_laps", 0)) + 1
         
         d["_rp"] = rp + ra
         d["points"] = safe_float(d.get("points", 0)) + pts
         
         # Calculate specialist metrics
-        # Position change (gained/lost positions)
-        if start_1 is not None and fin_1 is not None:
-            pos_change = start_1 - fin_1  # Positive = gained positions, Negative = lost positions
+        # Position change (gained/lost positions): positive = gained, negative = lost
+        pos_change = start_1 - fin_1 if start_1 is not None and fin_1 is not None else None
+        if pos_change is not None:
             d["position_change"] = safe_float(d.get("position_change", 0)) + pos_change
         
         # Store lap time data for consistency calculation
-        if "lap_times" not in d:
-            d["lap_times"] = []
+        lap_times = d.setdefault("lap_times", [])
         avg_lap = row.get("average_lap", 0)
         if avg_lap > 0:
-            d["lap_times"].append(avg_lap)
+            lap_times.append(avg_lap)
         
         # Store position change data
-        if "position_changes" not in d:
-            d["position_changes"] = []
-        if start_1 is not None and fin_1 is not None:
-            d["position_changes"].append(start_1 - fin_1)
+        position_changes = d.setdefault("position_changes", [])
+        if pos_change is not None:
+            position_changes.append(pos_change)
         
         # Store weather conditions
-        if "weather_conditions" not in d:
-            d["weather_conditions"] = []
-        weather_data = race_sessions[0].get("weather_result", {})
-        if weather_data:
-            d["weather_conditions"].append({
-                "temp": weather_data.get("avg_temp", 0),
-                "humidity": weather_data.get("avg_rel_humidity", 0),
-                "wind": weather_data.get("avg_wind_speed", 0),
-                "clouds": weather_data.get("avg_cloud_cover_pct", 0)
-            })
+        weather_conditions = d.setdefault("weather_conditions", [])
+        if weather_entry:
+            weather_conditions.append(dict(weather_entry))
         
         # Qualifying vs Race performance
-        if name in qual_lookup:
-            qual_row = qual_lookup[name]
+        qual_row = qual_lookup.get(name)
+        if qual_row is not None:
             qual_time = qual_row.get("best_qual_lap_time", -1)
-            race_time = row.get("best_lap_time", -1)
-            if qual_time > 0 and race_time > 0:
+            if qual_time > 0 and best_lap_time > 0:
                 # Calculate percentage difference (positive = race faster than qual)
-                qual_vs_race = ((qual_time - race_time) / qual_time) * 100
+                qual_vs_race = ((qual_time - best_lap_time) / qual_time) * 100
                 d["qual_vs_race"] = safe_float(d.get("qual_vs_race", 0)) + qual_vs_race
 
         updated += 1
@@ -1011,94 +1531,68 @@ def get_drivers_around_position(dataset: dict, metric: str, target_name: str, co
     Returns context drivers above and below the target driver.
     If user is in top positions, shows top 5 instead.
     """
-    rows = []
-    for name, d in dataset.items():
-        rows.append({
-            "name": name,
-            "flag": flag_shortcode(d.get("country") or ""),
-            "points": safe_float(d.get("points")),
-            "races": int(d.get("races") or 0),
-            "wins": int(d.get("wins") or 0),
-            "poles": int(d.get("poles") or 0),
-            "podiums": int(d.get("podiums") or 0),
-            "top10s": int(d.get("top10s") or d.get("top5s") or d.get("top5") or 0),
-            "avg_incidents": round(safe_float(d.get("avg_incidents")), 2),
-            "avg_start": round(safe_float(d.get("avg_start")), 2),
-            "avg_finish": round(safe_float(d.get("avg_finish")), 2),
-            "laps_complete": int(d.get("laps_complete") or 0),
-            "laps_lead": int(d.get("laps_lead") or 0),
-            "fastest_laps": int(d.get("fastest_laps") or 0),
-        })
-    
-    rows.sort(key=lambda r: _sort_key(metric, r), reverse=True)
+    # Shared sorted rows from the rows cache; the returned slice is copied below
+    rows = _rows_from_dataset(dataset, metric)
+    keys = _name_keys(rows)
     
     # Find target driver position with improved matching
     target_index = None
     target_name_clean = target_name.strip().lower()
     
     # Debug: Log the search attempt
-    print(console_safe(f"🔍 get_drivers_around_position: Looking for '{target_name}' (cleaned: '{target_name_clean}')"))
-    print(console_safe(f"🔍 Available names: {[row['name'] for row in rows[:5]]}..."))
-    
-    # Log all names for debugging (only if there are fewer than 50 names to avoid spam)
-    if len(rows) <= 50:
-        print(console_safe(f"🔍 All available names: {[row['name'] for row in rows]}"))
-    else:
-        print(console_safe(f"🔍 Total names: {len(rows)} (showing first 10): {[row['name'] for row in rows[:10]]}"))
+    if DEBUG_FIND_ME:
+        print(console_safe(f"🔍 get_drivers_around_position: Looking for '{target_name}' (cleaned: '{target_name_clean}')"))
+        print(console_safe(f"🔍 Available names: {[row['name'] for row in rows[:5]]}..."))
+        
+        # Log all names for debugging (only if there are fewer than 50 names to avoid spam)
+        if len(rows) <= 50:
+            print(console_safe(f"🔍 All available names: {[row['name'] for row in rows]}"))
+        else:
+            print(console_safe(f"🔍 Total names: {len(rows)} (showing first 10): {[row['name'] for row in rows[:10]]}"))
     
-    # First try exact match
-    for i, row in enumerate(rows):
-        if row["name"].strip().lower() == target_name_clean:
-            target_index = i
-            print(console_safe(f"✅ Exact match found at position {i}: '{row['name']}'"))
-            break
+    # First try exact match (first row wins on duplicate cleaned names)
+    target_index = keys["clean_idx"].get(target_name_clean)
+    if target_index is not None and DEBUG_FIND_ME:
+        print(console_safe(f"✅ Exact match found at position {target_index}: '{rows[target_index]['name']}'"))
     
     # If no exact match, try various fuzzy matching strategies
     if target_index is None:
-        print(console_safe("🔍 No exact match, trying fuzzy matching..."))
+        if DEBUG_FIND_ME:
+            print(console_safe("🔍 No exact match, trying fuzzy matching..."))
         
         # Strategy 1: Remove all spaces and compare
         target_no_spaces = target_name_clean.replace(" ", "")
-        for i, row in enumerate(rows):
-            row_name_clean = row["name"].strip().lower()
-            row_no_spaces = row_name_clean.replace(" ", "")
-            if target_no_spaces == row_no_spaces:
-                target_index = i
-                print(console_safe(f"✅ Space-removed match found at position {i}: '{row['name']}'"))
-                break
+        target_index = keys["nospace_idx"].get(target_no_spaces)
+        if target_index is not None and DEBUG_FIND_ME:
+            print(console_safe(f"✅ Space-removed match found at position {target_index}: '{rows[target_index]['name']}'"))
         
         # Strategy 2: Check if one name contains the other
         if target_index is None:
-            for i, row in enumerate(rows):
-                row_name_clean = row["name"].strip().lower()
-                if (target_name_clean in row_name_clean or row_name_clean in target_name_clean):
-                    target_index = i
-                    print(console_safe(f"✅ Contains match found at position {i}: '{row['name']}'"))
-                    break
+            target_index = _contains_match(keys, target_name_clean)
+            if target_index is not None and DEBUG_FIND_ME:
+                print(console_safe(f"✅ Contains match found at position {target_index}: '{rows[target_index]['name']}'"))
         
         # Strategy 3: Check for common variations (numbers, special characters)
         if target_index is None:
             # Remove numbers and special characters for comparison
-            target_clean = ''.join(c for c in target_name_clean if c.isalpha() or c.isspace())
-            for i, row in enumerate(rows):
-                row_name_clean = row["name"].strip().lower()
-                row_clean = ''.join(c for c in row_name_clean if c.isalpha() or c.isspace())
-                if target_clean == row_clean:
-                    target_index = i
-                    print(console_safe(f"✅ Cleaned match found at position {i}: '{row['name']}'"))
-                    break
+            target_index = _alpha_index(keys).get(target_name_clean.translate(_ALPHA_KEEP))
+            if target_index is not None and DEBUG_FIND_ME:
+                print(console_safe(f"✅ Cleaned match found at position {target_index}: '{rows[target_index]['name']}'"))
         
         # Strategy 4: Check for reversed first/last names
         if target_index is None:
             target_parts = target_name_clean.split()
             if len(target_parts) >= 2:
                 target_reversed = f"{target_parts[-1]} {' '.join(target_parts[:-1])}"
-                for i, row in enumerate(rows):
-                    row_name_clean = row["name"].strip().lower()
-                    if row_name_clean == target_reversed:
-                        target_index = i
-                        print(console_safe(f"✅ Reversed name match found at position {i}: '{row['name']}'"))
-                        break
+                target_index = keys["clean_idx"].get(target_reversed)
+                if target_index is not None and DEBUG_FIND_ME:
+                    print(console_safe(f"✅ Reversed name match found at position {target_index}: '{rows[target_index]['name']}'"))
+        
+        # Strategy 5: Edit-distance match over the cleaned names (needs rapidfuzz)
+        if target_index is None:
+            target_index = _fuzzy_match(keys, target_name_clean)
+            if target_index is not None and DEBUG_FIND_ME:
+                print(console_safe(f"✅ Fuzzy match found at position {target_index}: '{rows[target_index]['name']}'"))
     
     if target_index is None:
         return []
@@ -1113,11 +1607,12 @@ def get_drivers_around_position(dataset: dict, metric: str, target_name: str, co
         start = max(0, target_index - context)
         end = min(len(rows), target_index + context + 1)
     
-    # Add global position to each row
-    for i, row in enumerate(rows[start:end]):
-        row["global_position"] = start + i + 1  # +1 because positions are 1-based
-    
-    return rows[start:end]
+    return _page_rows(rows, start, end)
+
+# Rendered stat lines per driver dict, keyed by identity; the dicts come from the
+# shared read-only caches, so a hit is always current
+_BLOCK_BODY_CACHE: dict[int, tuple[dict, str]] = {}
+_BLOCK_BODY_CACHE_MAX = 512
 
 def render_driver_block(title_flag_name: str, d: Dict, show_person_emoji: bool = False) -> str:
     # Handle the title line and person emoji placement
@@ -1128,7 +1623,18 @@ def render_driver_block(title_flag_name: str, d: Dict, show_person_emoji: bool =
         # Normal title without emoji
         title_line = f"**{title_flag_name}**" if title_flag_name else ""
     
-    # Calculate completion percentage based on races the driver actually participated in
+    cached = _BLOCK_BODY_CACHE.get(id(d))
+    if cached and cached[0] is d:
+        body = cached[1]
+    else:
+        body = _driver_block_body(d)
+        if len(_BLOCK_BODY_CACHE) >= _BLOCK_BODY_CACHE_MAX:
+            _BLOCK_BODY_CACHE.pop(next(iter(_BLOCK_BODY_CACHE)))
+        _BLOCK_BODY_CACHE[id(d)] = (d, body)
+    return f"{title_line}\n{body}"
+
+def _driver_block_body(d: Dict) -> str:
+    """Stat lines of a driver block (everything below the title)"""
     races = int(d.get('races', 0))
     laps_complete = int(d.get('laps_complete', 0))
     laps_lead = int(d.get('laps_lead', 0))
@@ -1136,7 +1642,6 @@ def render_driver_block(title_flag_name: str, d: Dict, show_person_emoji: bool =
     podiums = int(d.get('podiums', 0))
     top10s = int(d.get('top10s', d.get('top5s', d.get('top5', 0))))
     poles = int(d.get('poles', 0))
-    race_distances = d.get('race_distances', [])
     
     # Get percentage values from data (already calculated in _aggregate_career)
     wins_pct = safe_float(d.get('wins_pct', 0))
@@ -1146,23 +1651,10 @@ def render_driver_block(title_flag_name: str, d: Dict, show_person_emoji: bool =
     laps_complete_pct = safe_float(d.get('laps_complete_pct', 0))
     laps_lead_pct = safe_float(d.get('laps_lead_pct', 0))
     
-    # Calculate completion percentage based on races the driver actually participated in
-    if races > 0 and race_distances:
-        # Calculate percentage based on total laps available from races this driver participated in
-        total_laps_available = sum(race_distances)
-        completion_pct = round((laps_complete / total_laps_available) * 100, 1) if total_laps_available > 0 else 0
-    elif races > 0:
-        # Fallback: Estimate total possible laps (assuming average race length)
-        estimated_total_laps = races * 20  # Assume average 20 laps per race
-        completion_pct = round((laps_complete / estimated_total_laps) * 100, 1) if estimated_total_laps > 0 else 0
-    else:
-        completion_pct = 0
-    
     # Use the calculated percentages from _aggregate_career() instead of hardcoded values
     # These percentages are already calculated as: (metric / races) * 100
     
     return (
-        f"{title_line}\n"
         f"🏎️ Races: **{races}**\n"
         f"🏆 Wins: **{wins}** - *{wins_pct}%*\n"
         f"🥈 Podiums: **{podiums}** - *{podiums_pct}%*\n"
@@ -1172,9 +1664,9 @@ def render_driver_block(title_flag_name: str, d: Dict, show_person_emoji: bool =
         f"⚡ Fastest Laps: **{int(d.get('fastest_laps', 0))}**\n"
         f"✅ Laps Completed: **{laps_complete}** - *{laps_complete_pct}%*\n"
         f"🚀 Laps Led: **{laps_lead}** - *{laps_lead_pct}%*\n"
-        f"🚦 Avg Start: **{round(safe_float(d.get('avg_start')), 2)}**\n"
-        f"🏁 Avg Finish: **{round(safe_float(d.get('avg_finish')), 2)}**\n"
-        f"⚠️ Avg Incidents: **{round(safe_float(d.get('avg_incidents')), 2)}**\n"
+        f"🚦 Avg Start: **{safe_float(d.get('avg_start')):.2f}**\n"
+        f"🏁 Avg Finish: **{safe_float(d.get('avg_finish')):.2f}**\n"
+        f"⚠️ Avg Incidents: **{safe_float(d.get('avg_incidents')):.2f}**\n"
         f"📊 Pos Gain/Loss: **{format_position_change(safe_float(d.get('position_change', 0)))}**"
     )
 
@@ -1204,12 +1696,13 @@ def render_leaderboard_embed(season_label: str, rows: list[dict], metric: str, c
     end_pos = min(current_page * 5, total_drivers)
     
     blocks = []
+    linked_name_clean = linked_driver_name.strip().lower() if linked_driver_name else None
     for i, r in enumerate(rows):
         # Calculate the actual global position based on current page
         global_position = start_pos + i
         
         # Check if this is the linked driver
-        is_linked_driver = linked_driver_name and r['name'].strip().lower() == linked_driver_name.strip().lower()
+        is_linked_driver = linked_name_clean is not None and r['name'].strip().lower() == linked_name_clean
         
         # Use render_driver_block for consistency with other pages
         blocks.append(render_driver_block(f"{global_position}. {r['flag']} {r['name']}", r, show_person_emoji=is_linked_driver))
@@ -1390,9 +1883,11 @@ class FindMeButton(discord.ui.Button):
                 return
         else:
             iracing_name = self.iracing_name
+        iracing_name_clean = iracing_name.strip().lower()
         
         # Debug: Log the search attempt
-        print(console_safe(f"🔍 Find Me: User {interaction.user.name} ({interaction.user.id}) searching for '{iracing_name}'"))
+        if DEBUG_FIND_ME:
+            print(console_safe(f"🔍 Find Me: User {interaction.user.name} ({interaction.user.id}) searching for '{iracing_name}'"))
         
         # Get current season and metric from view if available (for dropdown updates)
         current_season = getattr(self.view, 'season_choice', self.season_choice)
@@ -1410,117 +1905,49 @@ class FindMeButton(discord.ui.Button):
                 current_is_specialist = self.view.is_specialist
         elif hasattr(self.view, 'season_choice') and hasattr(self.view, 'metric'):
             # Called from FindMeResultsView - use current values from view
-            if current_season == "__CAREER__":
-                label, data = ("All Time", _aggregate_career())
-            elif not current_season:
-                ss = list_seasons()
-                current_season = ss[-1] if ss else None
-                if not current_season:
-                    label, data = ("All Time", {})
-                else:
-                    label, data = (current_season, load_season_drivers(current_season))
-            else:
-                label, data = (current_season, load_season_drivers(current_season))
+            current_season, label, data = _resolve_dataset(current_season)
         else:
             await interaction.response.send_message(content="❌ Error: Cannot determine dataset.", ephemeral=True)
             return
         
         # Debug: Log dataset info
-        print(console_safe(f"🔍 Find Me: Dataset '{label}' has {len(data)} drivers"))
-        if len(data) > 0:
-            sample_names = list(data.keys())[:3]
-            print(console_safe(f"🔍 Find Me: Sample names: {', '.join(sample_names)}"))
-        
-        # Check if user exists in the data with enhanced matching
-        iracing_name_clean = iracing_name.strip().lower()
-        user_found = False
-        
-        # Debug: Log the search attempt
-        print(console_safe(f"🔍 Find Me: Looking for '{iracing_name}' (cleaned: '{iracing_name_clean}') in {len(data)} drivers"))
-        
-        for name in data.keys():
-            name_clean = name.strip().lower()
-            # Try multiple matching strategies
-            if (name_clean == iracing_name_clean or
-                name_clean.replace(" ", "") == iracing_name_clean.replace(" ", "") or
-                iracing_name_clean in name_clean or name_clean in iracing_name_clean):
-                user_found = True
-                print(console_safe(f"✅ Find Me: Found match: '{name}'"))
-                break
-        
-        if not user_found:
-            # Provide more helpful debugging information
-            available_names = list(data.keys())[:10]  # Show first 10 names for debugging
-            
-            # Check for potential name variations
-            potential_matches = []
-            iracing_clean = iracing_name.lower().replace(" ", "")
-            for name in available_names:
-                name_clean = name.lower().replace(" ", "")
-                if (iracing_clean in name_clean or name_clean in iracing_clean or 
-                    iracing_clean.replace(" ", "") == name_clean.replace(" ", "")):
-                    potential_matches.append(name)
-            
-            error_msg = f"❌ **Could not find your iRacing name**\n\n"
-            error_msg += f"**Looking for:** `{iracing_name}`\n"
-            error_msg += f"**Available names in data:** {', '.join(available_names[:5])}{'...' if len(available_names) > 5 else ''}\n\n"
-            
-            if potential_matches:
-                error_msg += f"**🔍 Potential matches found:** {', '.join(potential_matches[:3])}\n\n"
-            
-            error_msg += "**Possible issues:**\n"
-            error_msg += "• Name spelling/formatting differences\n"
-            error_msg += "• You haven't raced in this season yet\n"
-            error_msg += "• Season data needs to be updated\n\n"
-            error_msg += "**Try:**\n"
-            error_msg += "• Check your exact iRacing name spelling\n"
-            error_msg += "• Use `/my_link` to verify your linked name\n"
-            error_msg += "• Try a different season or 'All Time' view\n"
-            if potential_matches:
-                error_msg += f"• Check if your name might be: {', '.join(potential_matches[:2])}"
-            
-            await interaction.response.send_message(content=error_msg, ephemeral=True)
-            return
+        if DEBUG_FIND_ME:
+            print(console_safe(f"🔍 Find Me: Dataset '{label}' has {len(data)} drivers"))
+            if len(data) > 0:
+                sample_names = list(islice(data.keys(), 3))
+                print(console_safe(f"🔍 Find Me: Sample names: {', '.join(sample_names)}"))
         
-        # Get all drivers sorted by metric for pagination
+        # Get all drivers sorted by metric (cached) and find the user's position in one pass
         rows = _rows_from_dataset(data, current_metric)
-        if not rows:
-            await interaction.response.send_message(content="❌ No data found for the selected season.", ephemeral=True)
-            return
-        
-        # Find user's position in the full list with enhanced matching
-        user_position = None
-        iracing_name_clean = iracing_name.strip().lower()
-        
-        # Debug: Log the search in pagination
-        print(console_safe(f"🔍 FindMe pagination: Looking for '{iracing_name}' (cleaned: '{iracing_name_clean}') in {len(rows)} rows"))
         
-        for i, row in enumerate(rows):
-            row_name_clean = row["name"].strip().lower()
-            
-            # Try multiple matching strategies
-            if (row_name_clean == iracing_name_clean or
-                row_name_clean.replace(" ", "") == iracing_name_clean.replace(" ", "") or
-                iracing_name_clean in row_name_clean or row_name_clean in iracing_name_clean):
-                user_position = i
-                print(console_safe(f"✅ FindMe pagination: Found match at position {i}: '{row['name']}'"))
-                break
+        user_position = _find_me_index(rows, iracing_name)
+        if DEBUG_FIND_ME:
+            print(console_safe(f"🔍 Find Me: Looking for '{iracing_name}' in {len(rows)} rows"))
+            if user_position is not None:
+                print(console_safe(f"✅ Find Me: Found match at position {user_position}: '{rows[user_position]['name']}'"))
         
         if user_position is None:
-            available_names = list(data.keys())[:10]
+            # Provide more helpful debugging information
+            available_names = list(islice(data.keys(), 10))  # Show first 10 names for debugging
             
             # Check for potential name variations
-            potential_matches = []
-            iracing_clean = iracing_name.lower().replace(" ", "")
-            for name in available_names:
-                name_clean = name.lower().replace(" ", "")
-                if (iracing_clean in name_clean or name_clean in iracing_clean or 
-                    iracing_clean.replace(" ", "") == name_clean.replace(" ", "")):
-                    potential_matches.append(name)
+            if RAPIDFUZZ_AVAILABLE and rows:
+                # Score every driver's cached cleaned name in C instead of substring-testing a sample
+                matches = fuzz_process.extract(iracing_name_clean, _name_keys(rows)["clean"],
+                                               scorer=fuzz.WRatio, score_cutoff=SUGGESTION_CUTOFF, limit=3)
+                potential_matches = [rows[i]["name"] for _, _, i in matches]
+            else:
+                potential_matches = []
+                iracing_name_nospace = iracing_name_clean.replace(" ", "")
+                for name in available_names:
+                    name_nospace = name.lower().replace(" ", "")
+                    if (iracing_name_nospace in name_nospace or name_nospace in iracing_name_nospace or 
+                        iracing_name_nospace == name_nospace):
+                        potential_matches.append(name)
             
             error_msg = f"❌ **Could not find your iRacing name**\n\n"
             error_msg += f"**Looking for:** `{iracing_name}`\n"
-            error_msg += f"**Available names in data:** {', '.join(potential_matches[:3])}\n\n"
+            error_msg += f"**Available names in data:** {', '.join(available_names[:5])}{'...' if len(available_names) > 5 else ''}\n\n"
             
             if potential_matches:
                 error_msg += f"**🔍 Potential matches found:** {', '.join(potential_matches[:3])}\n\n"
@@ -1538,7 +1965,7 @@ class FindMeButton(discord.ui.Button):
             
             await interaction.response.send_message(content=error_msg, ephemeral=True)
             return
-        
+
         # Calculate pagination to center the user's driver on the page
         total_drivers = len(rows)
         total_pages = max(1, (total_drivers + 4) // 5)  # 5 drivers per page
@@ -1566,211 +1993,36 @@ class FindMeButton(discord.ui.Button):
         user_rank = user_position + 1  # Convert to 1-indexed
         page_containing_user = (user_rank - 1) // 5  # 5 drivers per page
         
-        # If this was called from a leaderboard view, navigate to the user's page
-        if hasattr(self.view, 'current_page') and hasattr(self.view, 'refresh'):
-            # Update the view to show the page containing the user
-            self.view.current_page = page_containing_user
-            
-            # Update the leaderboard title to show the linked driver name with country flag
-            if hasattr(self.view, 'season_choice') and hasattr(self.view, 'metric'):
-                # Get the driver's country flag from the data
-                driver_flag = ""
-                for row in rows:
-                    if row['name'].strip().lower() == iracing_name.strip().lower():
-                        driver_flag = row['flag']
-                        break
-                
-                # Create custom title showing linked driver name with flag and rank
-                if hasattr(self.view, 'is_specialist') and self.view.is_specialist:
-                    custom_title = f"WiRL Specialist Leaderboard - {driver_flag} {iracing_name} (Rank {user_rank})"
-                else:
-                    custom_title = f"WiRL Leaderboard - {driver_flag} {iracing_name} (Rank {user_rank})"
-                
-                # Refresh the leaderboard to show the user's page with updated title
-                await self.view.refresh(interaction, custom_title)
-            else:
-                # Fallback if view doesn't have expected attributes
-                await self.view.refresh(interaction)
-        else:
-            # If not called from a leaderboard view, just show the position
-            await interaction.response.send_message(
-                f"🎯 **Find Me Results**\n\n"
-                f"**Your Driver Position: {user_rank} of {total_drivers}**\n\n"
-                f"Use `/leaderboard` to see the full leaderboard.",
-                ephemeral=True
-            )
-
-class NextPageButton(discord.ui.Button):
-    def __init__(self, current_page: int = 1):
-        super().__init__(style=discord.ButtonStyle.primary, label="Next", emoji="➡️", row=2)
-        self.current_page = current_page
-
-    async def callback(self, interaction: discord.Interaction):
-        view = self.view  # type: ignore
-        
-        # Get dataset
-        if hasattr(view, 'current_page') and hasattr(view, '_dataset'):
-            label, data = view._dataset()
-        else:
-            # Handle different view types
-            if hasattr(view, 'season_choice') and hasattr(view, 'metric'):
-                if view.season_choice == "__CAREER__":
-                    label, data = ("All Time", _aggregate_career())
-                else:
-                    label, data = (view.season_choice, load_season_drivers(view.season_choice))
-            else:
-                await interaction.response.send_message(content="❌ Error: Cannot determine dataset.", ephemeral=True)
-                return
-        
-        if not data:
-            await interaction.response.send_message(content="❌ No data found for the selected season.", ephemeral=True)
-            return
-        
-        # Calculate next page details
-        next_page = self.current_page + 1
-        start_pos = (next_page - 1) * 5
-        end_pos = start_pos + 5
-        
-        # Get all drivers and sort them
-        rows = []
-        for name, d in data.items():
-            rows.append({
-                "name": name,
-                "flag": flag_shortcode(d.get("country") or ""),
-                "points": safe_float(d.get("points")),
-                "races": int(d.get("races") or 0),
-                "wins": int(d.get("wins") or 0),
-                "poles": int(d.get("poles") or 0),
-                "podiums": int(d.get("podiums") or 0),
-                "top10s": int(d.get("top10s") or d.get("top5s") or d.get("top5") or 0),
-                "avg_incidents": round(safe_float(d.get("avg_incidents")), 2),
-                "avg_start": round(safe_float(d.get("avg_start")), 2),
-                "avg_finish": round(safe_float(d.get("avg_finish")), 2),
-                "laps_complete": int(d.get("laps_complete") or 0),
-                "laps_lead": int(d.get("laps_lead") or 0),
-                "fastest_laps": int(d.get("fastest_laps") or 0),
-                "race_distances": d.get("race_distances", []),
-                "position_change": safe_float(d.get("position_change")),
-            })
-        
-        rows.sort(key=lambda r: _sort_key(view.metric, r), reverse=True)
-        
-        # Get next 5 drivers
-        next_rows = rows[start_pos:end_pos] if len(rows) > start_pos else []
-        
-        if not next_rows:
-            await interaction.response.send_message(content="❌ No more drivers to show.", ephemeral=True)
-            return
-        
-        # Add global positions
-        for i, row in enumerate(next_rows):
-            row["global_position"] = start_pos + i + 1
-        
-        # Calculate total pages
-        total_drivers = len(rows)
-        total_pages = max(1, (total_drivers + 4) // 5)  # 5 drivers per page
-        
-        # Use standardized render function for consistent width and formatting
-        # Get linked driver name for this user
-        linked_driver_name = get_iracing_name(interaction.user.id)
-        
-        emb = render_leaderboard_embed(label, next_rows, view.metric, next_page, total_pages, linked_driver_name, total_drivers)
-        
-        # Check if there are more pages after this
-        has_more_pages = len(rows) > end_pos
-        
-        # Create view with Previous Page button and Next Page if more available
-        next_page_view = NextPageView(view.season_choice, view.metric, has_more_pages, next_page)
-        await interaction.response.edit_message(embed=emb, view=next_page_view)
-
-class PreviousPageButton(discord.ui.Button):
-    def __init__(self):
-        super().__init__(style=discord.ButtonStyle.primary, label="Previous", emoji="⬅️", row=2)
-
-    async def callback(self, interaction: discord.Interaction):
-        view = self.view  # type: ignore
-        
-        # Check if we're in a NextPageView (pagination context)
-        if hasattr(view, 'current_page') and view.current_page > 1:
-            # Go to previous page
-            previous_page = view.current_page - 1
-            start_pos = (previous_page - 1) * 5
-            end_pos = start_pos + 5
+        # If this was called from a leaderboard view, navigate to the user's page
+        if hasattr(self.view, 'current_page') and hasattr(self.view, 'refresh'):
+            # Update the view to show the page containing the user
+            self.view.current_page = page_containing_user
             
-            # Get dataset
-            if hasattr(view, '_dataset'):
-                label, data = view._dataset()
-            else:
-                # Handle different view types
-                if hasattr(view, 'season_choice') and hasattr(view, 'metric'):
-                    if view.season_choice == "__CAREER__":
-                        label, data = ("All Time", _aggregate_career())
-                    else:
-                        label, data = (view.season_choice, load_season_drivers(view.season_choice))
+            # Update the leaderboard title to show the linked driver name with country flag
+            if hasattr(self.view, 'season_choice') and hasattr(self.view, 'metric'):
+                # Get the driver's country flag from the data
+                flag_index = _name_keys(rows)["clean_idx"].get(iracing_name_clean)
+                driver_flag = rows[flag_index]['flag'] if flag_index is not None else ""
+                
+                # Create custom title showing linked driver name with flag and rank
+                if hasattr(self.view, 'is_specialist') and self.view.is_specialist:
+                    custom_title = f"WiRL Specialist Leaderboard - {driver_flag} {iracing_name} (Rank {user_rank})"
                 else:
-                    await interaction.response.send_message(content="❌ Error: Cannot determine dataset.", ephemeral=True)
-                    return
-            
-            if not data:
-                await interaction.response.send_message(content="❌ No data found for the selected season.", ephemeral=True)
-                return
-            
-            # Get all drivers and calculate previous page
-            rows = []
-            for name, d in data.items():
-                rows.append({
-                    "name": name,
-                    "flag": flag_shortcode(d.get("country") or ""),
-                    "points": safe_float(d.get("points")),
-                    "races": int(d.get("races") or 0),
-                    "wins": int(d.get("wins") or 0),
-                    "poles": int(d.get("poles") or 0),
-                    "podiums": int(d.get("podiums") or 0),
-                    "top10s": int(d.get("top10s") or d.get("top5s") or d.get("top5") or 0),
-                    "avg_incidents": round(safe_float(d.get("avg_incidents")), 2),
-                    "avg_start": round(safe_float(d.get("avg_start")), 2),
-                    "avg_finish": round(safe_float(d.get("avg_finish")), 2),
-                    "laps_complete": int(d.get("laps_complete") or 0),
-                    "laps_lead": int(d.get("laps_lead") or 0),
-                    "fastest_laps": int(d.get("fastest_laps") or 0),
-                    "race_distances": d.get("race_distances", []),
-                    "position_change": safe_float(d.get("position_change")),
-                })
-            
-            rows.sort(key=lambda r: _sort_key(view.metric, r), reverse=True)
-            
-            # Get previous page drivers
-            previous_page_drivers = rows[start_pos:end_pos]
-            
-            # Add global positions
-            for i, row in enumerate(previous_page_drivers):
-                row["global_position"] = start_pos + i + 1
-            
-            # Calculate total pages
-            total_drivers = len(rows)
-            total_pages = max(1, (total_drivers + 4) // 5)  # 5 drivers per page
-            
-            # Use standardized render function for consistent width and formatting
-            # Get linked driver name for this user
-            linked_driver_name = get_iracing_name(interaction.user.id)
-            
-            emb = render_leaderboard_embed(label, previous_page_drivers, view.metric, previous_page, total_pages, linked_driver_name, total_drivers)
-            
-            # Check if there are more pages after this
-            has_more_pages = len(rows) > end_pos
-            
-            # Create view with Previous Page button and Next Page if more available
-            if previous_page == 1:
-                # If going back to page 1, use the main LeaderboardView
-                main_view = LeaderboardView(view.season_choice, view.metric)
-                await interaction.response.edit_message(embed=emb, view=main_view)
+                    custom_title = f"WiRL Leaderboard - {driver_flag} {iracing_name} (Rank {user_rank})"
+                
+                # Refresh the leaderboard to show the user's page with updated title
+                await self.view.refresh(interaction, custom_title)
             else:
-                # Create NextPageView with Previous Page button
-                previous_page_view = NextPageView(view.season_choice, view.metric, has_more_pages, previous_page)
-                await interaction.response.edit_message(embed=emb, view=previous_page_view)
+                # Fallback if view doesn't have expected attributes
+                await self.view.refresh(interaction)
         else:
-            # We're already on page 1, do nothing
-            await interaction.response.send_message(content="ℹ️ Already on the first page.", ephemeral=True)
+            # If not called from a leaderboard view, just show the position
+            await interaction.response.send_message(
+                f"🎯 **Find Me Results**\n\n"
+                f"**Your Driver Position: {user_rank} of {total_drivers}**\n\n"
+                f"Use `/leaderboard` to see the full leaderboard.",
+                ephemeral=True
+            )
 
 class GoToTopButton(discord.ui.Button):
     def __init__(self):
@@ -1779,16 +2031,19 @@ class GoToTopButton(discord.ui.Button):
     async def callback(self, interaction: discord.Interaction):
         view = self.view  # type: ignore
         
+        # The main leaderboard can just jump back to its first page
+        if isinstance(view, LeaderboardView):
+            view.current_page = 0
+            await view.refresh(interaction)
+            return
+        
         # Get dataset and show top 5 drivers
         if hasattr(view, '_dataset'):
             label, data = view._dataset()
         else:
             # Handle different view types
             if hasattr(view, 'season_choice') and hasattr(view, 'metric'):
-                if view.season_choice == "__CAREER__":
-                    label, data = ("All Time", _aggregate_career())
-                else:
-                    label, data = (view.season_choice, load_season_drivers(view.season_choice))
+                _, label, data = _resolve_dataset(view.season_choice)
             else:
                 await interaction.response.send_message(content="❌ Error: Cannot determine dataset.", ephemeral=True)
                 return
@@ -1822,10 +2077,7 @@ class GoToBottomButton(discord.ui.Button):
         else:
             # Handle different view types
             if hasattr(view, 'season_choice') and hasattr(view, 'metric'):
-                if view.season_choice == "__CAREER__":
-                    label, data = ("All Time", _aggregate_career())
-                else:
-                    label, data = (view.season_choice, load_season_drivers(view.season_choice))
+                _, label, data = _resolve_dataset(view.season_choice)
             else:
                 await interaction.response.send_message(content="❌ Error: Cannot determine dataset.", ephemeral=True)
                 return
@@ -1835,29 +2087,7 @@ class GoToBottomButton(discord.ui.Button):
             return
         
         # Get all drivers and calculate last page
-        rows = []
-        for name, d in data.items():
-            rows.append({
-                "name": name,
-                "flag": flag_shortcode(d.get("country") or ""),
-                "points": safe_float(d.get("points")),
-                "races": int(d.get("races") or 0),
-                "wins": int(d.get("wins") or 0),
-                "poles": int(d.get("poles") or 0),
-                "podiums": int(d.get("podiums") or 0),
-                "top10s": int(d.get("top10s") or d.get("top5s") or d.get("top5") or 0),
-                "avg_incidents": round(safe_float(d.get("avg_incidents")), 2),
-                "avg_start": round(safe_float(d.get("avg_start")), 2),
-                "avg_finish": round(safe_float(d.get("avg_finish")), 2),
-                "laps_complete": int(d.get("laps_complete") or 0),
-                "laps_lead": int(d.get("laps_lead") or 0),
-                "fastest_laps": int(d.get("fastest_laps") or 0),
-                "race_distances": d.get("race_distances", []),
-                "position_change": safe_float(d.get("position_change")),
-            })
-        
-        # Use normal sorting to get correct rankings (best to worst)
-        rows.sort(key=lambda r: _sort_key(view.metric, r), reverse=True)
+        rows = _rows_from_dataset(data, view.metric)  # cached, already sorted best-first
         
         # Calculate last page
         total_drivers = len(rows)
@@ -1865,12 +2095,13 @@ class GoToBottomButton(discord.ui.Button):
         start_pos = (total_pages - 1) * 5  # Last page start position
         end_pos = total_drivers
         
-        # Get last page drivers and add global positions
-        last_page_drivers = rows[start_pos:end_pos]
+        # Already paginating: update this view in place instead of building a new one
+        if isinstance(view, NextPageView):
+            await view.goto_page(total_pages, interaction, keep_find_me_title=True)
+            return
         
-        # Add global positions to each driver for proper ranking display
-        for i, driver in enumerate(last_page_drivers):
-            driver['global_position'] = start_pos + i + 1
+        # Get last page drivers (render_leaderboard_embed numbers them from the page)
+        last_page_drivers = rows[start_pos:end_pos]
         
         # Use standardized render function for consistent width and formatting
         # Get linked driver name for this user
@@ -1906,15 +2137,36 @@ class NextPageView(discord.ui.View):
 
     def _dataset(self) -> tuple[str, dict]:
         # NextPageView dataset method
-        if self.season_choice == "__CAREER__":
-            return ("All Time", _aggregate_career())
-        if not self.season_choice:
-            ss = list_seasons()
-            self.season_choice = ss[-1] if ss else None
-        if not self.season_choice:
-            return ("All Time", {})
-        
-        return (self.season_choice, load_season_drivers(self.season_choice))
+        self.season_choice, label, data = _resolve_dataset(self.season_choice)
+        return (label, data)
+    
+    async def goto_page(self, page: int, interaction: discord.Interaction, keep_find_me_title: bool = False):
+        """Show a 1-based page on this view, toggling the navigation buttons in place"""
+        label, data = self._dataset()
+        if not data:
+            await interaction.response.send_message(content="❌ No data found for the selected season.", ephemeral=True)
+            return
+        
+        rows = _rows_from_dataset(data, self.metric)  # cached, already sorted best-first
+        start_pos = (page - 1) * 5
+        end_pos = start_pos + 5
+        page_rows = rows[start_pos:end_pos]
+        if not page_rows:
+            await interaction.response.send_message(content="❌ No more drivers to show.", ephemeral=True)
+            return
+        
+        total_drivers = len(rows)
+        total_pages = max(1, (total_drivers + 4) // 5)  # 5 drivers per page
+        self.current_page = page
+        self.has_more_pages = total_drivers > end_pos
+        self._update_button_states()
+        
+        # Get linked driver name for this user
+        linked_driver_name = get_iracing_name(interaction.user.id)
+        
+        emb = render_leaderboard_embed(label, page_rows, self.metric, page, total_pages, linked_driver_name, total_drivers,
+                                       interaction if keep_find_me_title else None)
+        await interaction.response.edit_message(embed=emb, view=self)
     
     def _update_button_states(self):
         """Update button states based on current page and data"""
@@ -1987,6 +2239,8 @@ class FindMeResultsView(discord.ui.View):
         self._initial_data = None
         self._initial_user_position = None
         self._initial_total_pages = None
+        self.total_pages: Optional[int] = None  # set whenever a page is rendered
+        self._last_render: Optional[tuple] = None  # (season, metric, rows) of the last centered refresh
         
     async def initialize_with_centered_data(self, interaction: discord.Interaction, rows: list, user_position: int, total_drivers: int):
         """Initialize the view with centered data around the user's driver"""
@@ -2028,21 +2282,16 @@ class FindMeResultsView(discord.ui.View):
         )
         
         # Format the display for centered view
-        blocks = []
-        for i, row in enumerate(centered_drivers):
-            global_pos = start_pos + i + 1
-            display_name = f"{global_pos}. {row['flag']} {row['name']}"
-            
-            # Check if this is the linked driver to show person emoji
-            row_name_clean = row["name"].strip().lower()
-            iracing_name_clean = self.iracing_name.strip().lower()
-            is_linked_driver = (row_name_clean == iracing_name_clean)
-            
-            # Use specialist driver block if this is a specialist view
-            if self.is_specialist:
-                blocks.append(render_specialist_driver_block(display_name, row, show_person_emoji=is_linked_driver))
-            else:
-                blocks.append(render_driver_block(display_name, row, show_person_emoji=is_linked_driver))
+        # Use specialist driver block if this is a specialist view; the linked driver
+        # (person emoji) is found via the names _name_keys already cleaned for these rows
+        render_block = render_specialist_driver_block if self.is_specialist else render_driver_block
+        clean_names = _name_keys(rows)["clean"]
+        iracing_name_clean = self.iracing_name.strip().lower()
+        blocks = [
+            render_block(f"{start_pos + i + 1}. {row['flag']} {row['name']}", row,
+                         show_person_emoji=(clean_names[start_pos + i] == iracing_name_clean))
+            for i, row in enumerate(centered_drivers)
+        ]
         
         emb.description += "\n\n".join(blocks)
         emb.set_footer(text=f"Sorted by: {metric_label}")
@@ -2060,35 +2309,14 @@ class FindMeResultsView(discord.ui.View):
         
     def _dataset(self) -> tuple[str, dict]:
         """Get dataset for this view - required for GoToBottomButton compatibility"""
-        if self.season_choice == "__CAREER__":
-            return ("All Time", _aggregate_career())
-        elif not self.season_choice:
-            ss = list_seasons()
-            self.season_choice = ss[-1] if ss else None
-            if not self.season_choice:
-                return ("All Time", {})
-            else:
-                return (self.season_choice, load_season_drivers(self.season_choice))
-        else:
-            return (self.season_choice, load_season_drivers(self.season_choice))
+        self.season_choice, label, data = _resolve_dataset(self.season_choice)
+        return (label, data)
 
     async def refresh_find_me(self, interaction: discord.Interaction):
         """Refresh the Find Me results with new season/metric selection"""
         
-        # Get dataset and find user's position
-        if self.season_choice == "__CAREER__":
-            label, data = ("All Time", _aggregate_career())
-        elif not self.season_choice:
-            ss = list_seasons()
-            self.season_choice = ss[-1] if ss else None
-            if not self.season_choice:
-                label, data = ("All Time", {})
-            else:
-                label = self.season_choice
-                data = load_season_drivers(self.season_choice)
-        else:
-            label = self.season_choice
-            data = load_season_drivers(self.season_choice)
+        # Get dataset and find user's position (season data and career totals are cached)
+        label, data = self._dataset()
         
         if not data:
             await interaction.response.send_message(content="❌ No data found for the selected season.", ephemeral=True)
@@ -2097,7 +2325,7 @@ class FindMeResultsView(discord.ui.View):
         # Get all drivers sorted by metric
         rows = _rows_from_dataset(data, self.metric)
         if not rows:
-            available_names = list(data.keys())[:10]
+            available_names = list(islice(data.keys(), 10))
             await interaction.response.edit_message(
                 content=f"❌ **Could not find your iRacing name**\n\n"
                 f"**Looking for:** `{self.iracing_name}`\n"
@@ -2115,20 +2343,18 @@ class FindMeResultsView(discord.ui.View):
             )
             return
         
+        # Re-selecting the current season/metric on unchanged data would redraw the same embed
+        last = self._last_render
+        if last is not None and last[0] == self.season_choice and last[1] == self.metric and last[2] is rows:
+            await interaction.response.defer()
+            return
+        
         # Find user's position in the full list with enhanced matching
-        user_position = None
-        iracing_name_clean = self.iracing_name.strip().lower()
-        for i, row in enumerate(rows):
-            row_name_clean = row["name"].strip().lower()
-            # Enhanced matching for FindMeResultsView
-            if (row_name_clean == iracing_name_clean or
-                row_name_clean.replace(" ", "") == iracing_name_clean.replace(" ", "") or
-                iracing_name_clean in row_name_clean or row_name_clean in row_name_clean):
-                user_position = i
-                break
+        # (indexed lookup on the cached name keys; substring matches via the trigram index)
+        user_position = _find_me_index(rows, self.iracing_name)
         
         if user_position is None:
-            available_names = list(data.keys())[:10]
+            available_names = list(islice(data.keys(), 10))
             await interaction.response.edit_message(
                 content=f"❌ **Could not find your iRacing name**\n\n"
                 f"**Looking for:** `{self.iracing_name}`\n"
@@ -2185,21 +2411,16 @@ class FindMeResultsView(discord.ui.View):
         )
         
         # Format the display for centered view
-        blocks = []
-        for i, row in enumerate(centered_drivers):
-            global_pos = start_pos + i + 1
-            display_name = f"{global_pos}. {row['flag']} {row['name']}"
-            
-            # Check if this is the linked driver to show person emoji
-            row_name_clean = row["name"].strip().lower()
-            iracing_name_clean = self.iracing_name.strip().lower()
-            is_linked_driver = (row_name_clean == iracing_name_clean)
-            
-            # Use specialist driver block if this is a specialist view
-            if self.is_specialist:
-                blocks.append(render_specialist_driver_block(display_name, row, show_person_emoji=is_linked_driver))
-            else:
-                blocks.append(render_driver_block(display_name, row, show_person_emoji=is_linked_driver))
+        # Use specialist driver block if this is a specialist view; the linked driver
+        # (person emoji) is found via the names _name_keys already cleaned for these rows
+        render_block = render_specialist_driver_block if self.is_specialist else render_driver_block
+        clean_names = _name_keys(rows)["clean"]
+        iracing_name_clean = self.iracing_name.strip().lower()
+        blocks = [
+            render_block(f"{start_pos + i + 1}. {row['flag']} {row['name']}", row,
+                         show_person_emoji=(clean_names[start_pos + i] == iracing_name_clean))
+            for i, row in enumerate(centered_drivers)
+        ]
         
         # For Find Me view, show "Your Driver Position" instead of "Showing drivers in positions"
         position_info = f"Your Driver Position is {start_pos + 1} of {total_drivers}"
@@ -2208,11 +2429,13 @@ class FindMeResultsView(discord.ui.View):
         
         # Update button states - ensure buttons are properly enabled/disabled
         self._update_button_states(total_pages)
+        self._last_render = (self.season_choice, self.metric, rows)
         
         await interaction.response.edit_message(embed=emb, view=self)
 
     def _update_button_states(self, total_pages: int):
         """Update the state of all navigation buttons"""
+        self.total_pages = total_pages
         for item in self.children:
             if isinstance(item, FindMePreviousPageButton):
                 item.disabled = (self.page <= 0)
@@ -2225,18 +2448,8 @@ class FindMeResultsView(discord.ui.View):
 
     async def show_page(self, interaction: discord.Interaction, page: int):
         """Show a specific page of the Find Me results"""
-        # Get dataset
-        if self.season_choice == "__CAREER__":
-            label, data = ("All Time", _aggregate_career())
-        elif not self.season_choice:
-            ss = list_seasons()
-            self.season_choice = ss[-1] if ss else None
-            if not self.season_choice:
-                label, data = ("All Time", {})
-            else:
-                label, data = (self.season_choice, load_season_drivers(self.season_choice))
-        else:
-            label, data = (self.season_choice, load_season_drivers(self.season_choice))
+        # Get dataset (season data and career totals are cached)
+        label, data = self._dataset()
         
         if not data:
             await interaction.response.send_message(content="❌ No data found for the selected season.", ephemeral=True)
@@ -2255,6 +2468,7 @@ class FindMeResultsView(discord.ui.View):
         # Ensure page is within bounds
         page = max(0, min(page, total_pages - 1))
         self.page = page
+        self._last_render = None  # paged away from the centered view
         
         # Calculate start and end positions for the page
         start_pos = page * 5
@@ -2280,29 +2494,21 @@ class FindMeResultsView(discord.ui.View):
         )
         
         # Format the display for the page
-        blocks = []
-        for i, row in enumerate(page_drivers):
-            global_pos = start_pos + i + 1
-            display_name = f"{global_pos}. {row['flag']} {row['name']}"
-            
-            # Check if this is the linked driver to show person emoji
-            row_name_clean = row["name"].strip().lower()
-            iracing_name_clean = self.iracing_name.strip().lower()
-            is_linked_driver = (row_name_clean == iracing_name_clean)
-            
-            # Use specialist driver block if this is a specialist view
-            if self.is_specialist:
-                blocks.append(render_specialist_driver_block(display_name, row, show_person_emoji=is_linked_driver))
-            else:
-                blocks.append(render_driver_block(display_name, row, show_person_emoji=is_linked_driver))
+        # Use specialist driver block if this is a specialist view; the linked driver
+        # (person emoji) is found via the names _name_keys already cleaned for these rows
+        render_block = render_specialist_driver_block if self.is_specialist else render_driver_block
+        clean_names = _name_keys(rows)["clean"]
+        iracing_name_clean = self.iracing_name.strip().lower()
+        blocks = [
+            render_block(f"{start_pos + i + 1}. {row['flag']} {row['name']}", row,
+                         show_person_emoji=(clean_names[start_pos + i] == iracing_name_clean))
+            for i, row in enumerate(page_drivers)
+        ]
         
         # For Find Me view, show "Your Driver Position" instead of "Showing drivers in positions"
         # Find the actual ranking of the linked driver
-        linked_driver_ranking = None
-        for i, row in enumerate(rows):
-            if row['name'].strip().lower() == self.iracing_name.strip().lower():
-                linked_driver_ranking = i + 1
-                break
+        linked_index = _name_keys(rows)["clean_idx"].get(iracing_name_clean)
+        linked_driver_ranking = linked_index + 1 if linked_index is not None else None
         
         position_info = f"Your Driver Position is {linked_driver_ranking} of {total_drivers}"
         emb.description = f"Sorted by: {metric_label}\n\n{position_info}\n\n" + "\n\n".join(blocks)
@@ -2332,28 +2538,8 @@ class FindMeNextPageButton(discord.ui.Button):
     async def callback(self, interaction: discord.Interaction):
         view: "FindMeResultsView" = self.view  # type: ignore
         
-        # Get dataset to check if there are more pages
-        if view.season_choice == "__CAREER__":
-            label, data = ("All Time", _aggregate_career())
-        elif not view.season_choice:
-            ss = list_seasons()
-            view.season_choice = ss[-1] if ss else None
-            if not view.season_choice:
-                label, data = ("All Time", {})
-            else:
-                label, data = (view.season_choice, load_season_drivers(view.season_choice))
-        else:
-            label, data = (view.season_choice, load_season_drivers(view.season_choice))
-        
-        if not data:
-            await interaction.response.send_message(content="❌ No data found for the selected season.", ephemeral=True)
-            return
-        
-        # Check if there are more pages
-        total_drivers = len(data)
-        total_pages = max(1, (total_drivers + 4) // 5)  # 5 drivers per page
-        
-        if view.page < total_pages - 1:
+        # Page count comes from the last render (no dataset reload); show_page clamps to the current rows
+        if view.total_pages is None or view.page < view.total_pages - 1:
             view.page += 1
             await view.show_page(interaction, view.page)
         else:
@@ -2411,6 +2597,7 @@ class LeaderboardView(discord.ui.View):
         self.metric = metric
         self.current_page = 0
         self.drivers_per_page = 5  # Show 5 drivers per page
+        self._rows_ref: Optional[list[dict]] = None  # cached sorted rows for the current season/metric
         self.add_item(SeasonDropdown(self.season_choice))
         self.add_item(MetricDropdown(self.metric))
         self.add_item(FindMeButton(self.season_choice, self.metric, None, False))
@@ -2423,118 +2610,20 @@ class LeaderboardView(discord.ui.View):
         self._update_button_states()
 
     def _dataset(self) -> tuple[str, dict]:
-        if self.season_choice == "__CAREER__":
-            return ("All Time", _aggregate_career())
-        if not self.season_choice:
-            ss = list_seasons()
-            self.season_choice = ss[-1] if ss else None
-        if not self.season_choice:
-            return ("All Time", {})
-        
-        return (f"{self.season_choice}", load_season_drivers(self.season_choice))
-
-    def _get_rows(self) -> list[dict]:
-        """Get all rows without limit, then paginate them"""
-        label, data = self._dataset()
-        # Get ALL rows without limit, then paginate them
-        all_rows = _rows_from_dataset(data, self.metric, limit=None)
-        return all_rows
-
-    def _get_paginated_rows(self) -> list[dict]:
-        """Get the current page of rows"""
-        all_rows = self._get_rows()
-        start_idx = self.current_page * self.drivers_per_page
-        end_idx = start_idx + self.drivers_per_page
-        return all_rows[start_idx:end_idx]
-
-    def _update_button_states(self):
-        """Update button states based on current page"""
-        all_rows = self._get_rows()
-        total_pages = max(1, (len(all_rows) + self.drivers_per_page - 1) // self.drivers_per_page)
-        
-        # Find and update all navigation buttons
-        for item in self.children:
-            if isinstance(item, PreviousPageButton):
-                item.disabled = (self.current_page <= 0)
-            elif isinstance(item, NextPageButton):
-                item.disabled = (self.current_page >= total_pages - 1)
-            elif isinstance(item, GoToTopButton):
-                item.disabled = (self.current_page <= 0)
-            elif isinstance(item, GoToBottomButton):
-                item.disabled = (self.current_page >= total_pages - 1)
-
-    async def refresh(self, interaction: discord.Interaction, custom_title: str = None):
-        label, data = self._dataset()
-        rows = self._get_paginated_rows()
-        # Calculate total pages
-        total_drivers = len(self._get_rows())
-        total_pages = max(1, (total_drivers + self.drivers_per_page - 1) // self.drivers_per_page)
-        
-        # Get linked driver name for this user
-        linked_driver_name = get_iracing_name(interaction.user.id)
-        
-        emb = render_leaderboard_embed(label, rows, self.metric, self.current_page + 1, total_pages, linked_driver_name, total_drivers)
-        
-        # Override title if custom title is provided
-        if custom_title:
-            emb.title = custom_title
-        
-        # Update button states
-        self._update_button_states()
-        
-        try:
-            await interaction.response.edit_message(embed=emb, view=self)
-        except discord.InteractionResponded:
-            await interaction.edit_original_response(embed=emb, view=self)
+        self.season_choice, label, data = _resolve_dataset(self.season_choice)
+        return (label, data)
 
-    async def show(self, interaction: discord.Interaction):
+    def _load_rows(self) -> tuple[str, list[dict]]:
+        """Resolve the dataset once and keep a reference to its cached sorted rows"""
         label, data = self._dataset()
-        rows = self._get_paginated_rows()
-        # Calculate total pages
-        total_drivers = len(self._get_rows())
-        total_pages = max(1, (total_drivers + self.drivers_per_page - 1) // self.drivers_per_page)
-        
-        # Get linked driver name for this user
-        linked_driver_name = get_iracing_name(interaction.user.id)
-        
-        emb = render_leaderboard_embed(label, rows, self.metric, self.current_page + 1, total_pages, linked_driver_name, total_drivers)
-        
-        # Update button states
-        self._update_button_states()
-        
-        await interaction.response.send_message(embed=emb, view=self, ephemeral=True)
-
-    async def go_to_page(self, page: int, interaction: discord.Interaction):
-        """Go to a specific page"""
-        all_rows = self._get_rows()
-        total_pages = max(1, (len(all_rows) + self.drivers_per_page - 1) // self.drivers_per_page)
-        
-        if 0 <= page < total_pages:
-            self.current_page = page
-            await self.refresh(interaction)
-        else:
-            await interaction.response.send_message(f"❌ Invalid page. Available pages: 1-{total_pages}", ephemeral=True)
-
-
-
-
-    def _dataset(self) -> tuple[str, dict]:
-        if self.season_choice == "__CAREER__":
-            return ("All Time", _aggregate_career())
-        if not self.season_choice:
-            ss = list_seasons()
-            self.season_choice = ss[-1] if ss else None
-        if not self.season_choice:
-            return ("All Time", {})
-        
-        return (f"{self.season_choice}", load_season_drivers(self.season_choice))
+        self._rows_ref = _rows_from_dataset(data, self.metric, limit=None)
+        return label, self._rows_ref
 
     def _get_rows(self) -> list[dict]:
         """Get all rows without limit, then paginate them"""
-        label, data = self._dataset()
-        # Get ALL rows without limit, then paginate them
-        all_rows = _rows_from_dataset(data, self.metric, limit=None)
-        return all_rows
+        if self._rows_ref is None:
+            self._load_rows()
+        return self._rows_ref
 
     def _get_paginated_rows(self) -> list[dict]:
         """Get the current page of rows"""
@@ -2560,10 +2649,11 @@ class LeaderboardView(discord.ui.View):
                 item.disabled = (self.current_page >= total_pages - 1)
 
     async def refresh(self, interaction: discord.Interaction, custom_title: str = None):
-        label, data = self._dataset()
+        # Re-resolve once per interaction so new uploads show up; everything below reuses the reference
+        label, all_rows = self._load_rows()
         rows = self._get_paginated_rows()
         # Calculate total pages
-        total_drivers = len(self._get_rows())
+        total_drivers = len(all_rows)
         total_pages = max(1, (total_drivers + self.drivers_per_page - 1) // self.drivers_per_page)
         
         # Get linked driver name for this user
@@ -2584,10 +2674,11 @@ class LeaderboardView(discord.ui.View):
             await interaction.edit_original_response(embed=emb, view=self)
 
     async def show(self, interaction: discord.Interaction):
-        label, data = self._dataset()
+        # Re-resolve once per interaction so new uploads show up; everything below reuses the reference
+        label, all_rows = self._load_rows()
         rows = self._get_paginated_rows()
         # Calculate total pages
-        total_drivers = len(self._get_rows())
+        total_drivers = len(all_rows)
         total_pages = max(1, (total_drivers + self.drivers_per_page - 1) // self.drivers_per_page)
         
         # Get linked driver name for this user
@@ -2939,6 +3030,10 @@ class PreviousPageButton(discord.ui.Button):
     
     async def callback(self, interaction: discord.Interaction):
         view = self.view  # type: ignore
+        # Leaderboard pages past the first: page in place (NextPageView pages are 1-based)
+        if isinstance(view, NextPageView):
+            await view.goto_page(max(1, view.current_page - 1), interaction)
+            return
         if hasattr(view, 'current_page') and view.current_page > 0:
             # Ensure we don't skip any ranks by going to the previous page
             view.current_page -= 1
@@ -2959,11 +3054,16 @@ class NextPageButton(discord.ui.Button):
     
     async def callback(self, interaction: discord.Interaction):
         view = self.view  # type: ignore
+        # Leaderboard pages past the first: page in place (goto_page reports running off the end)
+        if isinstance(view, NextPageView):
+            await view.goto_page(view.current_page + 1, interaction)
+            return
         if hasattr(view, 'current_page'):
             # Check if this is a leaderboard view or driver stats view
             if hasattr(view, 'refresh'):
-                # Leaderboard view - calculate total pages from _get_rows()
-                all_rows = view._get_rows()
+                # Leaderboard view - re-resolve the rows first so a season that grew
+                # since the last click can be paged past its old last page
+                _, all_rows = view._load_rows()
                 total_pages = max(1, (len(all_rows) + view.drivers_per_page - 1) // view.drivers_per_page)
                 if view.current_page < total_pages - 1:
                     view.current_page += 1
@@ -3218,13 +3318,11 @@ class DriverSearchModal(discord.ui.Modal, title="Search Drivers"):
         
         if not results:
             # Get some sample data to show what's available
-            sample_drivers = list(self.data_source.items())[:3]
+            sample_drivers = list(islice(self.data_source.items(), 3))
             sample_text = ""
             if sample_drivers:
-                sample_text = f"\n\n**Sample available drivers:**\n"
-                for name, data in sample_drivers:
-                    country = data.get("country", "Unknown")
-                    sample_text += f"• {name} ({country.upper()})\n"
+                sample_text = f"\n\n**Sample available drivers:**\n" + "".join(
+                    f"• {name} ({data.get('country', 'Unknown').upper()})\n" for name, data in sample_drivers)
             
             await interaction.response.send_message(
                 f"🔍 **No drivers found** matching '{search_term}'{sample_text}",
@@ -3390,10 +3488,8 @@ class DriversSeasonDropdown(discord.ui.Select):
         else:
             dmap = load_season_drivers(season)
             title = f"{season}"
-        # Create list with flags and names, then sort by full driver name (not by flag)
-        driver_entries = [(name, f"{flag_shortcode(d.get('country') or '')} {name}") for name, d in dmap.items()]
-        driver_entries.sort(key=lambda x: x[0].lower())  # Sort by full driver name
-        names = [entry[1] for entry in driver_entries]  # Extract the formatted strings
+        # Flag + name lines sorted by full driver name (cached per dataset)
+        names = _driver_list_names(dmap)
         # update parent view with dataset for pagination
         view: "DriversView" = self.view  # type: ignore
         if isinstance(view, DriversView):
@@ -3432,12 +3528,12 @@ class DriversView(discord.ui.View):
             return "_No drivers found._"
         start = self.page * PAGE_SIZE
         end = start + PAGE_SIZE
-        sliced = self.names[start:end]
         
         # Add showing drivers info
         showing_info = f"Showing drivers in list {start + 1}-{min(end, len(self.names))} of {len(self.names)}\n\n"
         
-        return showing_info + "\n".join(f"{i+1+start}. {n}" for i, n in enumerate(sliced))
+        # Numbered lines are built once per (cached) names list; each page is a slice
+        return showing_info + "\n".join(_numbered_lines(self.names)[start:end])
 
     async def rerender(self, interaction: discord.Interaction):
         emb = discord.Embed(title=f"{self.title}", description=self.render_description(), color=discord.Color.teal())
@@ -3513,6 +3609,42 @@ def backup_due() -> bool:
     except Exception:
         return True
 
+def backup_compression() -> Tuple[int, Optional[int]]:
+    """Zip method and level for backups, from config["backups"] (default: DEFLATE level 1)"""
+    backup_cfg = config.get("backups") or {}
+    if str(backup_cfg.get("method", "")).upper() == "ZIP_STORED":
+        return zipfile.ZIP_STORED, None
+    return zipfile.ZIP_DEFLATED, int(backup_cfg.get("compression_level", 1))
+
+BACKUP_READ_AHEAD = 4  # files read ahead (and held in memory) while the zip is being written
+
+def _read_backup_entry(entry: Tuple[str, str]) -> Tuple[zipfile.ZipInfo, bytes]:
+    path, arcname = entry
+    info = zipfile.ZipInfo.from_file(path, arcname, strict_timestamps=False)
+    with open(path, "rb") as f:
+        return info, f.read()
+
+def write_backup_zip(dest, entries: List[Tuple[str, str]]) -> None:
+    """
+    Write (path, arcname) entries to a zip at dest (path or file object).
+    Files are read ahead on a small thread pool while the previous entry is compressed;
+    at most BACKUP_READ_AHEAD files are held in memory at once.
+    """
+    method, level = backup_compression()
+    pending = deque()
+    with zipfile.ZipFile(dest, "w", method, allowZip64=True, compresslevel=level) as z, \
+            ThreadPoolExecutor(max_workers=BACKUP_READ_AHEAD) as pool:
+        for entry in entries:
+            pending.append(pool.submit(_read_backup_entry, entry))
+            if len(pending) >= BACKUP_READ_AHEAD:
+                info, content = pending.popleft().result()
+                info.compress_type = method
+                z.writestr(info, content, compresslevel=level)
+        while pending:
+            info, content = pending.popleft().result()
+            info.compress_type = method
+            z.writestr(info, content, compresslevel=level)
+
 def save_backup_to_disk() -> str:
     """Save a backup of all bot data to disk"""
     try:
@@ -3520,18 +3652,19 @@ def save_backup_to_disk() -> str:
         backup_filename = f"backup_{timestamp}.zip"
         backup_path = os.path.join(BACKUPS_DIR, backup_filename)
         
-        with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add data directory
-            if os.path.exists(DATA_ROOT):
-                for root, dirs, files in os.walk(DATA_ROOT):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, os.path.dirname(DATA_ROOT))
-                        zipf.write(file_path, arcname)
-            
-            # Add config file
-            if os.path.exists(CONFIG_FILE):
-                zipf.write(CONFIG_FILE, "config.json")
+        entries = []
+        # Add data directory
+        if os.path.exists(DATA_ROOT):
+            for root, dirs, files in os.walk(DATA_ROOT):
+                for file in files:
+                    file_path = os.path.join(root, file)
+                    arcname = os.path.relpath(file_path, os.path.dirname(DATA_ROOT))
+                    entries.append((file_path, arcname))
+        
+        # Add config file
+        if os.path.exists(CONFIG_FILE):
+            entries.append((CONFIG_FILE, "config.json"))
+        write_backup_zip(backup_path, entries)
         
         # Update last backup timestamp
         with open(BACKUP_STATE, "w") as f:
@@ -3545,19 +3678,24 @@ def save_backup_to_disk() -> str:
         return ""
 
 def create_backup_zip() -> Tuple[discord.File, str]:
-    """Create a backup zip file and return it as a Discord file attachment"""
+    """
+    Create a backup zip file and return it as a Discord file attachment.
+    The archive is streamed to an anonymous temp file (removed once the attachment
+    is closed) rather than held in memory; call via asyncio.to_thread from async code.
+    """
     stamp = tz_now().strftime("%Y-%m-%d_%H-%M")
-    mem = io.BytesIO()
-    with zipfile.ZipFile(mem, "w", zipfile.ZIP_DEFLATED) as z:
-        if os.path.exists(CONFIG_FILE):
-            z.write(CONFIG_FILE, arcname="config.json")
-        for root, _, files in os.walk(DATA_ROOT):
-            for file in files:
-                fpath = os.path.join(root, file)
-                arc = os.path.relpath(fpath, DATA_ROOT)
-                z.write(fpath, arcname=os.path.join("data", arc))
-    mem.seek(0)
-    return discord.File(mem, filename=f"backup_{stamp}.zip"), stamp
+    tmp = tempfile.TemporaryFile(suffix=".zip")
+    entries = []
+    if os.path.exists(CONFIG_FILE):
+        entries.append((CONFIG_FILE, "config.json"))
+    for root, _, files in os.walk(DATA_ROOT):
+        for file in files:
+            fpath = os.path.join(root, file)
+            arc = os.path.relpath(fpath, DATA_ROOT)
+            entries.append((fpath, os.path.join("data", arc)))
+    write_backup_zip(tmp, entries)
+    tmp.seek(0)
+    return discord.File(tmp, filename=f"backup_{stamp}.zip"), stamp
 
 # ========= Background Tasks =========
 @tasks.loop(hours=24)
@@ -3571,22 +3709,24 @@ async def auto_backup():
             print(console_safe("⏰ Backup not due yet, skipping..."))
             return
         
-        # Perform the backup
-        path = save_backup_to_disk()
+        # Perform the backup in a worker thread so the event loop stays responsive
+        path = await asyncio.to_thread(save_backup_to_disk)
         if path:
             print(console_safe(f"✅ Automatic backup completed: {os.path.basename(path)}"))
             
-            # Send notification to logs channel if configured
-            try:
-                emb = discord.Embed(
-                    title="🔄 Automatic Backup Completed",
-                    description=f"Saved `{os.path.basename(path)}`",
-                    color=discord.Color.green(),
-                    timestamp=tz_now()
-                )
-                await send_to_logs(emb)
-            except Exception as e:
-                print(console_safe(f"⚠️ Could not send backup notification: {e}"))
+            # Send notification to logs channel and upload to Google Drive concurrently
+            emb = discord.Embed(
+                title="🔄 Automatic Backup Completed",
+                description=f"Saved `{os.path.basename(path)}`",
+                color=discord.Color.green(),
+                timestamp=tz_now()
+            )
+            jobs = [send_to_logs(emb)]
+            if config.get("google_drive", {}).get("auto_backup", True):
+                jobs.append(backup_to_google_drive(path))
+            for result in await asyncio.gather(*jobs, return_exceptions=True):
+                if isinstance(result, Exception):
+                    print(console_safe(f"⚠️ Backup follow-up failed: {result}"))
         else:
             print(console_safe("❌ Automatic backup failed"))
             
@@ -3629,11 +3769,10 @@ async def cleanup_old_backups():
         print(console_safe("🧹 Starting backup cleanup..."))
         
         # Get list of backup files
-        backup_files = []
-        for file in os.listdir(BACKUPS_DIR):
-            if file.endswith('.zip') and file != '.last_backup.txt':
-                file_path = os.path.join(BACKUPS_DIR, file)
-                backup_files.append((file_path, os.path.getmtime(file_path)))
+        # scandir hands back each entry's path and stat, so no join/getmtime per file
+        with os.scandir(BACKUPS_DIR) as it:
+            backup_files = [(e.path, e.stat().st_mtime) for e in it
+                            if e.name.endswith('.zip') and e.is_file()]
         
         # Sort by modification time (oldest first)
         backup_files.sort(key=lambda x: x[1])
@@ -3695,6 +3834,24 @@ async def sync_commands_periodic():
     except Exception as e:
         print(console_safe(f"❌ Error in periodic command sync: {e}"))
 
+@tasks.loop(seconds=2)
+async def flush_config():
+    """Debounced config writer: persists at most one config write every 2 seconds"""
+    if not _config_dirty.is_set():
+        return
+    try:
+        _config_dirty.clear()
+        # Snapshot on the loop (nothing can mutate config mid-dump), write in a worker thread
+        data = json_dumps_bytes(config)
+        await asyncio.to_thread(_write_config_bytes, data)
+    except Exception as e:
+        _config_dirty.set()  # retry on the next tick
+        print(console_safe(f"❌ Failed to save config: {e}"))
+
+@flush_config.after_loop
+async def flush_config_on_stop():
+    flush_config_now()
+
 # ========= Events =========
 @bot.event
 async def on_ready():
@@ -3788,13 +3945,15 @@ async def upload_cmd(interaction: discord.Interaction, file: discord.Attachment)
     raw = await file.read()
     
     # Check for duplicate content
-    is_duplicate, existing_file = _is_duplicate_json(raw)
+    # Hash once (off the event loop); the same digest indexes the file after ingest
+    content_hash = await asyncio.to_thread(_generate_content_hash, raw)
+    is_duplicate, existing_file = await _is_duplicate_json(raw, content_hash)
     if is_duplicate:
         await interaction.response.send_message(f"⚠️ **Duplicate detected!** This JSON content already exists in `{existing_file}`. Upload cancelled to prevent duplicate data.", ephemeral=True)
         return
     
     # Create season selection view
-    view = UploadSeasonSelectView(file.filename, raw)
+    view = UploadSeasonSelectView(file.filename, raw, content_hash)
     await interaction.response.send_message(
         f"📁 **File ready:** `{file.filename}`\n\nSelect which season to upload this file into:",
         view=view,
@@ -3802,6 +3961,9 @@ async def upload_cmd(interaction: discord.Interaction, file: discord.Attachment)
     )
 
 # ========= Refresh Commands (Admin) =========
+COMMAND_SYNC_DEBOUNCE_SECONDS = 30  # reuse the last sync result for repeat refreshes inside this window
+_last_command_sync: Optional[tuple[float, int, list[str]]] = None  # (monotonic time, total synced, guild results)
+
 @tree.command(name="admin_refresh_commands", description="Refresh/sync all slash commands.")
 @GDEC
 async def refresh_commands_cmd(interaction: discord.Interaction):
@@ -3817,48 +3979,70 @@ async def refresh_commands_cmd(interaction: discord.Interaction):
         commands_before = tree.get_commands()
         before_count = len(commands_before)
         
-        # Clear global commands first to prevent duplicates
-        try:
-            await tree.sync()  # Clear global commands
-            print(console_safe("🧹 Cleared global commands to prevent duplicates"))
-        except:
-            pass
+        # Discord rate-limits command syncs, so repeat refreshes within the debounce
+        # window reuse the previous result instead of syncing again (only fully
+        # successful syncs are kept, so retrying after a failure always re-syncs)
+        global _last_command_sync
+        now = time.monotonic()
+        reused = bool(_last_command_sync and now - _last_command_sync[0] < COMMAND_SYNC_DEBOUNCE_SECONDS)
+        if reused:
+            synced_at, total_synced, guild_sync_results = _last_command_sync
+            print(console_safe(f"⏱️ Skipping command sync: last sync was {now - synced_at:.0f}s ago"))
+        else:
+            # Clear global commands first to prevent duplicates
+            try:
+                await tree.sync()  # Clear global commands
+                print(console_safe("🧹 Cleared global commands to prevent duplicates"))
+            except:
+                pass
         
-        # Sync commands to all configured guilds
-        total_synced = 0
-        guild_sync_results = []
+            # Sync commands to all configured guilds
+            total_synced = 0
+            guild_sync_results = []
+            all_synced = True
         
-        for guild_obj in GUILD_OBJECTS:
-            try:
-                synced_commands = await tree.sync(guild=guild_obj)
-                guild_synced = len(synced_commands)
-                total_synced += guild_synced
-                guild_sync_results.append(f"• Guild {guild_obj.id}: {guild_synced} commands")
-                print(console_safe(f"✅ Synced {guild_synced} commands to guild {guild_obj.id}"))
-            except Exception as guild_error:
-                guild_sync_results.append(f"• Guild {guild_obj.id}: ❌ Failed - {guild_error}")
-                print(console_safe(f"❌ Failed to sync to guild {guild_obj.id}: {guild_error}"))
+            for guild_obj in GUILD_OBJECTS:
+                try:
+                    synced_commands = await tree.sync(guild=guild_obj)
+                    guild_synced = len(synced_commands)
+                    total_synced += guild_synced
+                    guild_sync_results.append(f"• Guild {guild_obj.id}: {guild_synced} commands")
+                    print(console_safe(f"✅ Synced {guild_synced} commands to guild {guild_obj.id}"))
+                except Exception as guild_error:
+                    all_synced = False
+                    guild_sync_results.append(f"• Guild {guild_obj.id}: ❌ Failed - {guild_error}")
+                    print(console_safe(f"❌ Failed to sync to guild {guild_obj.id}: {guild_error}"))
         
-        # Detailed response with command info
-        response = f"✅ **Successfully refreshed all slash commands!**\n\n"
-        response += f"📊 **Command Summary:**\n"
-        response += f"• Commands registered: {before_count}\n"
-        response += f"• Total commands synced across all guilds: {total_synced}\n"
-        response += f"• Global commands cleared to prevent duplicates\n\n"
+            _last_command_sync = (now, total_synced, guild_sync_results) if all_synced else None
         
-        response += f"🏠 **Guild Sync Results:**\n"
-        response += "\n".join(guild_sync_results)
+        # Detailed response with command info
+        if reused:
+            header = (f"⏱️ **Slash commands were already refreshed {now - synced_at:.0f}s ago** — showing that result "
+                      f"instead of syncing again (try again after {COMMAND_SYNC_DEBOUNCE_SECONDS}s to force a new sync).\n")
+        else:
+            header = "✅ **Successfully refreshed all slash commands!**\n"
+        parts = [
+            header,
+            "📊 **Command Summary:**",
+            f"• Commands registered: {before_count}",
+            f"• Total commands synced across all guilds: {total_synced}",
+            "• Global commands cleared to prevent duplicates\n",
+            "🏠 **Guild Sync Results:**",
+            "\n".join(guild_sync_results),
+        ]
         
         if before_count != total_synced:
-            response += f"\n\n⚠️ **Note:** Command count mismatch detected. Some commands may not have synced properly."
+            parts.append("\n⚠️ **Note:** Command count mismatch detected. Some commands may not have synced properly.")
         
-        response += f"\n\n💡 **Use `/help` to see the updated command list** (auto-generated from current commands)"
-        response += f"\n🔍 **Use `/commands_info` for detailed command analysis**"
+        parts.append("\n💡 **Use `/help` to see the updated command list** (auto-generated from current commands)")
+        parts.append("🔍 **Use `/commands_info` for detailed command analysis**")
+        response = "\n".join(parts)
         
         await interaction.followup.send(response, ephemeral=True)
         
         # Log to console
-        print(console_safe(f"🔄 Commands refreshed: {before_count} registered → {total_synced} synced across {len(GUILD_OBJECTS)} guilds"))
+        if not reused:
+            print(console_safe(f"🔄 Commands refreshed: {before_count} registered → {total_synced} synced across {len(GUILD_OBJECTS)} guilds"))
         
     except Exception as e:
         await interaction.followup.send(f"❌ Failed to refresh commands: `{e}`", ephemeral=True)
@@ -3941,10 +4125,8 @@ async def drivers_cmd(interaction: discord.Interaction):
         await interaction.response.send_message("⚠️ No seasons found.", ephemeral=True); return
     season = current_season_name() or seasons[-1]
     dmap = load_season_drivers(season)
-    # Create list with flags and names, then sort by full driver name (not by flag)
-    driver_entries = [(name, f"{flag_shortcode(d.get('country') or '')} {name}") for name, d in dmap.items()]
-    driver_entries.sort(key=lambda x: x[0].lower())  # Sort by full driver name
-    names = [entry[1] for entry in driver_entries]  # Extract the formatted strings
+    # Flag + name lines sorted by full driver name (cached per dataset)
+    names = _driver_list_names(dmap)
     view = DriversView(season)
     view.names = names
     
@@ -4005,7 +4187,7 @@ class SeasonDeleteConfirmView(discord.ui.View):
         
         import shutil
         try:
-            shutil.rmtree(ensure_season_dir(self.season_to_delete))
+            await asyncio.to_thread(shutil.rmtree, ensure_season_dir(self.season_to_delete))
             await interaction.followup.send(f"🗑 **Season Deleted Successfully**\n\nSeason **📅 {self.season_to_delete}** has been permanently removed.", ephemeral=True)
         except Exception as e:
             await interaction.followup.send(f"❌ **Deletion Failed**\n\nCould not delete season **📅 {self.season_to_delete}**: `{e}`", ephemeral=True)
@@ -4086,7 +4268,7 @@ class SeasonRenameModal(discord.ui.Modal, title="Rename Season"):
             await interaction.response.send_message("❌ A season with that name already exists.", ephemeral=True)
             return
         try:
-            shutil.move(src, dst)
+            await asyncio.to_thread(shutil.move, src, dst)
             if current_season_name() == old_name:
                 set_current_season(new_name)
             await interaction.response.send_message(f"✅ Renamed **📅 {old_name}** → **📅 {new_name}**.", ephemeral=True)
@@ -4114,20 +4296,28 @@ async def season_rename_cmd(interaction: discord.Interaction):
     await interaction.response.send_message("Pick a season to rename:", view=view, ephemeral=True)
 
 # ========= Career wipes =========
+def _wipe_driver_from_seasons(driver: str) -> bool:
+    """Drop a driver from every season that has them; True if any season changed"""
+    removed_any = False
+    for s in list_seasons():
+        current = load_season_drivers(s)  # cached, shared: membership check only
+        if driver not in current:
+            continue
+        # Only a top-level key is removed, so a shallow copy is enough to keep the cached map intact
+        m = dict(current)
+        del m[driver]
+        save_season_drivers(s, m)
+        removed_any = True
+    return removed_any
+
 @tree.command(name="admin_career_wipe_driver", description="Wipe a single driver's stats from ALL seasons")
 @GDEC
 @app_commands.describe(driver="Driver name (exact match)")
 async def career_wipe_driver(interaction: discord.Interaction, driver: str):
     if not is_admin(interaction.user):
         await interaction.response.send_message("🚫 Admins only.", ephemeral=True); return
-    removed_any = False
     try:
-        for s in list_seasons():
-            m = load_season_drivers(s)
-            if driver in m:
-                del m[driver]
-                save_season_drivers(s, m)
-                removed_any = True
+        removed_any = await asyncio.to_thread(_wipe_driver_from_seasons, driver)
         if removed_any:
             await interaction.response.send_message(f"🧨 Removed **{driver}** from all seasons.", ephemeral=True)
         else:
@@ -4142,7 +4332,7 @@ async def backup_now(interaction: discord.Interaction):
     if not is_admin(interaction.user):
         await interaction.response.send_message("🚫 Admins only.", ephemeral=True); return
     await interaction.response.defer(ephemeral=True)
-    path = save_backup_to_disk()
+    path = await asyncio.to_thread(save_backup_to_disk)
     await interaction.followup.send(f"✅ Backup saved: `{os.path.basename(path)}` (max {MAX_BACKUPS} backups).", ephemeral=True)
 
 @tree.command(name="admin_backup_info", description="Show backup status (last run & retention)")
@@ -4187,6 +4377,8 @@ async def sync_all_data_cmd(interaction: discord.Interaction):
             current_season = current_season_name()
             if current_season:
                 response += f"🔄 **Auto-Processing JSON Files...**\n\n"
+                # One line per uploaded file, joined once (the file list is unbounded)
+                file_lines = []
                 
                 for filename in uploaded_files:
                     try:
@@ -4202,22 +4394,24 @@ async def sync_all_data_cmd(interaction: discord.Interaction):
                             # Try to process the file
                             file_path = os.path.join(UPLOADS_STORE_DIR, filename)
                             if os.path.exists(file_path):
-                                with open(file_path, 'r', encoding='utf-8') as f:
+                                with open(file_path, 'rb') as f:
                                     file_content = f.read()
                                 
                                 # Process the file into the current season
                                 processed = process_json_into_season(file_content, current_season)
                                 if processed:
                                     processed_files.append(filename)
-                                    response += f"✅ **Processed:** `{filename}` → {current_season}\n"
+                                    file_lines.append(f"✅ **Processed:** `{filename}` → {current_season}\n")
                                 else:
-                                    response += f"⚠️ **Failed to process:** `{filename}`\n"
+                                    file_lines.append(f"⚠️ **Failed to process:** `{filename}`\n")
                             else:
-                                response += f"⚠️ **File not found:** `{filename}`\n"
+                                file_lines.append(f"⚠️ **File not found:** `{filename}`\n")
                         else:
-                            response += f"ℹ️ **Already processed:** `{filename}`\n"
+                            file_lines.append(f"ℹ️ **Already processed:** `{filename}`\n")
                     except Exception as e:
-                        response += f"❌ **Error processing:** `{filename}` - {e}\n"
+                        file_lines.append(f"❌ **Error processing:** `{filename}` - {e}\n")
+                
+                response += "".join(file_lines)
                 
                 if processed_files:
                     response += f"\n🔄 **Refreshing data after processing...**\n"
@@ -4377,9 +4571,10 @@ class UploadsMultiDeleteButton(discord.ui.Button):
             
             try:
                 if os.path.exists(path):
-                    with open(path, "rb") as f:
-                        file_content = f.read()
-                    os.remove(path)
+                    # File I/O runs off the event loop so large uploads don't stall the gateway
+                    file_content = await asyncio.to_thread(_read_bytes, path)
+                    await asyncio.to_thread(os.remove, path)
+                    _unindex_uploads([filename])
                     seasons_affected = await _remove_ingested_data(file_content)
                     
                     nv = UploadsMultiManageView()
@@ -4406,39 +4601,12 @@ class UploadsMultiDeleteButton(discord.ui.Button):
             await interaction.response.defer(ephemeral=True)
             
             try:
-                total_deleted = 0
-                total_seasons_affected = set()
-                results = []
-                
-                for filename in filenames:
-                    path = os.path.join(UPLOADS_STORE_DIR, filename)
-                    if os.path.exists(path):
-                        try:
-                            with open(path, "rb") as f:
-                                file_content = f.read()
-                            os.remove(path)
-                            
-                            seasons_affected = await _remove_ingested_data(file_content)
-                            total_seasons_affected.update(seasons_affected)
-                            total_deleted += 1
-                            
-                            if seasons_affected:
-                                results.append(f"✅ `{filename}`: Deleted, data removed from {len(seasons_affected)} season(s)")
-                            else:
-                                results.append(f"✅ `{filename}`: Deleted (no ingested data)")
-                                
-                        except Exception as e:
-                            results.append(f"❌ `{filename}`: Failed - {e}")
-                    else:
-                        results.append(f"⚠️ `{filename}`: Already deleted")
+                # One pass over the seasons for all selected files
+                total_deleted, total_seasons_affected, results = await _delete_uploads(filenames)
                 
                 # Create summary message
-                summary = f"🗑 **Multiple Delete Summary**\n\n"
-                summary += f"📁 **Files processed:** {len(filenames)}\n"
-                summary += f"🗑 **Successfully deleted:** {total_deleted}\n"
-                if total_seasons_affected:
-                    summary += f"📊 **Seasons affected:** {', '.join(sorted(total_seasons_affected))}\n"
-                summary += f"\n**Results:**\n" + "\n".join(results)
+                summary = _delete_summary("🗑 **Multiple Delete Summary**", len(filenames), total_deleted,
+                                          total_seasons_affected, results)
                 
                 # Send updated response
                 await interaction.followup.send(
@@ -4506,43 +4674,12 @@ class DeleteConfirmView(discord.ui.View):
                 # Multiple file deletion
                 filenames = self.files_to_delete
             
-            total_deleted = 0
-            total_seasons_affected = set()
-            results = []
-            
-            for filename in filenames:
-                path = os.path.join(UPLOADS_STORE_DIR, filename)
-                if os.path.exists(path):
-                    try:
-                        with open(path, "rb") as f:
-                            file_content = f.read()
-                        
-                        seasons_affected = await _remove_ingested_data(file_content)
-                        os.remove(path)
-                        total_seasons_affected.update(seasons_affected)
-                        total_deleted += 1
-                        
-                        if seasons_affected:
-                            results.append(f"✅ `{filename}`: Deleted, data removed from {len(seasons_affected)} season(s)")
-                        else:
-                            results.append(f"✅ `{filename}`: Deleted (no ingested data)")
-                            
-                    except Exception as e:
-                        results.append(f"❌ `{filename}`: Failed - {e}")
-                else:
-                    results.append(f"⚠️ `{filename}`: Already deleted")
+            # One pass over the seasons for all selected files
+            total_deleted, total_seasons_affected, results = await _delete_uploads(filenames)
             
             # Create summary message
-            if len(filenames) == 1:
-                summary = f"🗑 **File Deleted Successfully**\n\n"
-            else:
-                summary = f"🗑 **Delete Summary**\n\n"
-            
-            summary += f"📁 **Files processed:** {len(filenames)}\n"
-            summary += f"🗑 **Successfully deleted:** {total_deleted}\n"
-            if total_seasons_affected:
-                summary += f"📊 **Seasons affected:** {', '.join(sorted(total_seasons_affected))}\n"
-            summary += f"\n**Results:**\n" + "\n".join(results)
+            title = "🗑 **File Deleted Successfully**" if len(filenames) == 1 else "🗑 **Delete Summary**"
+            summary = _delete_summary(title, len(filenames), total_deleted, total_seasons_affected, results)
             
             # Send updated response
             await interaction.followup.send(
@@ -4583,16 +4720,16 @@ class DeleteConfirmView(discord.ui.View):
 
 
 class UploadSeasonSelectView(discord.ui.View):
-    def __init__(self, filename: str, file_content: bytes):
+    def __init__(self, filename: str, file_content: bytes, content_hash: Optional[str] = None):
         super().__init__(timeout=300)
         self.filename = filename
         self.file_content = file_content
-        self.add_item(UploadSeasonDropdown(filename, file_content))
+        self.add_item(UploadSeasonDropdown(filename, file_content, content_hash))
 
 
 
 class UploadSeasonDropdown(discord.ui.Select):
-    def __init__(self, filename: str, file_content: bytes):
+    def __init__(self, filename: str, file_content: bytes, content_hash: Optional[str] = None):
         # Get available seasons
         seasons = list_seasons()
         
@@ -4613,6 +4750,7 @@ class UploadSeasonDropdown(discord.ui.Select):
         )
         self.filename = filename
         self.file_content = file_content
+        self.content_hash = content_hash
 
     async def callback(self, interaction: discord.Interaction):
         try:
@@ -4622,7 +4760,7 @@ class UploadSeasonDropdown(discord.ui.Select):
             
             # Parse and ingest the JSON data
             print(f"DEBUG: Parsing JSON content of {len(self.file_content)} bytes")
-            data = json.loads(self.file_content.decode("utf-8"))
+            data = json_loads(self.file_content)
             print(f"DEBUG: JSON parsed successfully")
             
             ensure_season_dir(selected_season)
@@ -4635,8 +4773,8 @@ class UploadSeasonDropdown(discord.ui.Select):
             fname = _sanitize_filename(self.filename)
             stamp = tz_now().strftime("%Y%m%d_%H%M%S")
             out_name = f"{stamp}_{fname}"
-            with open(os.path.join(UPLOADS_STORE_DIR, out_name), "wb") as f:
-                f.write(self.file_content)
+            await asyncio.to_thread(_write_bytes, os.path.join(UPLOADS_STORE_DIR, out_name), self.file_content)
+            _index_upload(out_name, self.file_content, self.content_hash)
             print(f"DEBUG: File saved as: {out_name}")
             
             season_display = selected_season
@@ -4805,6 +4943,7 @@ async def admin_unlink_cmd(interaction: discord.Interaction, discord_user: disco
 
 
 # ========= Help and commands info =========
+@functools.lru_cache(maxsize=1)  # the text is fixed for the life of the process
 def generate_dynamic_help() -> str:
     """Generate help text dynamically from registered commands"""
     
@@ -4915,6 +5054,10 @@ async def on_ready():
     except Exception as e:
         print(console_safe(f"❌ Failed to sync commands: {e}"))
     
+    # Start the debounced config writer (on_ready can fire again on reconnect)
+    if not flush_config.is_running():
+        flush_config.start()
+    
     print(console_safe("🚀 Bot is ready to receive commands!"))
 
 # ========= Run =========
@@ -4922,4 +5065,6 @@ if not TOKEN or TOKEN == "YOUR_DISCORD_BOT_TOKEN":
     print(console_safe("❌ Put your real bot token into config.json under key 'token'."))
 else:
     print(console_safe("🚀 Starting WiRL Stats Bot with 24/7 capabilities..."))
-    bot.run(TOKEN)
\ No newline at end of file
+    bot.run(TOKEN)
+    # Persist any config change still waiting for the background flush
+    flush_config_now()
\ No newline at end of file